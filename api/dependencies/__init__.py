@@ -0,0 +1,2 @@
+from .auth import get_token_data, get_current_user, check_is_admin, verify_admin
+from .bot import set_bot, get_bot
@@ -1,12 +1,37 @@
 from fastapi import Depends, HTTPException
-from api.utils.security_utils import decode_token
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from api.models.auth import TokenData
+from api.models.user import UserRole
+from api.service.auth_service import AuthService
+from .services import _service
 
-# Contoh penggunaan dengan FastAPI OAuth2PasswordBearer
-# from fastapi.security import OAuth2PasswordBearer
-# oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+_bearer = HTTPBearer()
 
-def get_current_user(token: str):  # Ganti dengan Depends(oauth2_scheme) jika pakai FastAPI
-    try:
-        return decode_token(token)
-    except Exception:
+# All auth dependencies are async: FastAPI runs sync dependencies in the
+# threadpool, and verification is a cache lookup on the shared AuthService.
+# The AuthService singleton is taken directly rather than via
+# Depends(get_auth_service): every authenticated route sits on top of
+# get_token_data, so that would be one more node solved on each request.
+
+async def get_token_data(
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer)
+) -> TokenData:
+    """Verified claims of the bearer token, resolved once per request"""
+    auth_service: AuthService = _service(AuthService)
+    valid, token_data = await auth_service.verify_token(credentials.credentials)
+    if not valid:
         raise HTTPException(status_code=401, detail="Invalid token")
+    return token_data
+
+async def get_current_user(token_data: TokenData = Depends(get_token_data)) -> str:
+    return token_data.username
+
+async def check_is_admin(token_data: TokenData = Depends(get_token_data)) -> bool:
+    """Non-raising admin flag for handlers that relax checks for admins"""
+    return token_data.role == UserRole.ADMIN
+
+async def verify_admin(token_data: TokenData = Depends(get_token_data)) -> str:
+    """Admin gate on the signed role claim; no database lookup per request"""
+    if token_data.role != UserRole.ADMIN:
+        raise HTTPException(status_code=403, detail="Admin access required")
+    return token_data.username
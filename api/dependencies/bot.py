@@ -0,0 +1,9 @@
+_bot = None
+
+def set_bot(bot) -> None:
+    """Register the running bot for request handlers"""
+    global _bot
+    _bot = bot
+
+async def get_bot():
+    return _bot
\ No newline at end of file
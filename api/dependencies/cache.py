@@ -1,5 +1,6 @@
 from typing import Any, Optional
 from functools import wraps
+from fastapi.encoders import jsonable_encoder
 from api.Config.cache import CACHE_CONFIG, CACHE_TTL, CACHE_KEY_PATTERNS
 from .redis import redis_client
 from .logger import logger
@@ -25,7 +26,7 @@ class CacheManager:
             
     async def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         try:
-            data = json.dumps(value)
+            data = json.dumps(jsonable_encoder(value))
             return self.client.set(key, data, ex=ttl)
         except Exception as e:
             logger.error(f"Cache set error: {str(e)}")
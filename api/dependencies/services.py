@@ -0,0 +1,47 @@
+from functools import lru_cache
+
+from ..service.auth_service import AuthService
+from ..service.audit_service import AuditService
+from ..service.balance_service import BalanceService
+from ..service.notifications_service import NotificationService
+from ..service.product_service import ProductService
+from ..service.settings_service import SettingsService
+from ..service.stock_service import StockService
+from ..service.transaction_service import TransactionService
+from ..service.user_service import UserService
+
+# Services are stateless apart from their caches and write buffers, so one
+# instance per process is shared by every request instead of built per call.
+# The providers are async so FastAPI calls them inline rather than sending
+# each one through the threadpool.
+
+@lru_cache(maxsize=None)
+def _service(cls: type):
+    return cls()
+
+async def get_auth_service() -> AuthService:
+    return _service(AuthService)
+
+async def get_audit_service() -> AuditService:
+    return _service(AuditService)
+
+async def get_balance_service() -> BalanceService:
+    return _service(BalanceService)
+
+async def get_notification_service() -> NotificationService:
+    return _service(NotificationService)
+
+async def get_product_service() -> ProductService:
+    return _service(ProductService)
+
+async def get_settings_service() -> SettingsService:
+    return _service(SettingsService)
+
+async def get_stock_service() -> StockService:
+    return _service(StockService)
+
+async def get_transaction_service() -> TransactionService:
+    return _service(TransactionService)
+
+async def get_user_service() -> UserService:
+    return _service(UserService)
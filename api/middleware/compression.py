@@ -125,7 +125,7 @@ class CompressionMiddleware:
             content_length = int(response.headers.get("content-length", 0))
             if content_length < 1024:  # Skip if < 1KB
                 return True
-        except:
+        except (TypeError, ValueError):
             pass
 
         # Skip for specific paths
@@ -3,6 +3,7 @@ from typing import Dict, Optional
 from functools import wraps
 import traceback
 import logging
+import os
 from fastapi import Request, Response
 from ..service.logs_service import LogService
 from ..service.audit_service import AuditService
@@ -24,7 +25,7 @@ class LoggingMiddleware:
 
     async def __call__(self, request: Request, call_next):
         # Generate request ID
-        request_id = request.headers.get("X-Request-ID", str(uuid4()))
+        request_id = request.headers.get("X-Request-ID") or os.urandom(16).hex()
         request.state.request_id = request_id
 
         # Get user info from request if available
@@ -35,24 +36,22 @@ class LoggingMiddleware:
         start_time = datetime.now(UTC)
 
         try:
-            # Create request log
-            await self.log_service.create_log(
-                Log(
-                    level=LogLevel.INFO,
-                    category=LogCategory.API,
-                    message=f"Incoming {request.method} request to {request.url.path}",
-                    source="LoggingMiddleware",
-                    timestamp=start_time,
-                    user_id=user_id,
-                    ip_address=ip_address,
-                    metadata={
-                        "request_id": request_id,
-                        "method": request.method,
-                        "path": str(request.url.path),
-                        "query_params": dict(request.query_params),
-                        "headers": dict(request.headers),
-                    }
-                )
+            # Queue request log (batched insert, no model construction)
+            self.log_service.enqueue_log(
+                level=LogLevel.INFO,
+                category=LogCategory.API,
+                message=f"Incoming {request.method} request to {request.url.path}",
+                source="LoggingMiddleware",
+                timestamp=start_time,
+                user_id=user_id,
+                ip_address=ip_address,
+                metadata={
+                    "request_id": request_id,
+                    "method": request.method,
+                    "path": str(request.url.path),
+                    "query_params": dict(request.query_params),
+                    "headers": dict(request.headers),
+                }
             )
 
             # Process request
@@ -61,28 +60,25 @@ class LoggingMiddleware:
             # Calculate duration
             duration = (datetime.now(UTC) - start_time).total_seconds()
 
-            # Create response log
-            await self.log_service.create_log(
-                Log(
-                    level=LogLevel.INFO,
-                    category=LogCategory.API,
-                    message=f"Completed {request.method} request to {request.url.path}",
-                    source="LoggingMiddleware",
-                    timestamp=datetime.now(UTC),
-                    user_id=user_id,
-                    ip_address=ip_address,
-                    metadata={
-                        "request_id": request_id,
-                        "status_code": response.status_code,
-                        "duration": duration,
-                        "headers": dict(response.headers)
-                    }
-                )
+            # Queue response log
+            self.log_service.enqueue_log(
+                level=LogLevel.INFO,
+                category=LogCategory.API,
+                message=f"Completed {request.method} request to {request.url.path}",
+                source="LoggingMiddleware",
+                user_id=user_id,
+                ip_address=ip_address,
+                metadata={
+                    "request_id": request_id,
+                    "status_code": response.status_code,
+                    "duration": duration,
+                    "headers": dict(response.headers)
+                }
             )
 
-            # Create audit log for important operations
+            # Queue audit log for important operations
             if request.method in ["POST", "PUT", "DELETE", "PATCH"]:
-                await self.audit_service.log_action(
+                self.audit_service.enqueue_action(
                     category=AuditCategory.SYSTEM,
                     action=AuditAction(request.method.lower()),
                     actor_id=user_id or "anonymous",
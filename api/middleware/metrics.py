@@ -4,7 +4,7 @@ import time
 import logging
 from datetime import datetime, UTC
 from typing import Optional, Dict, Any
-from uuid import uuid4
+import os
 
 from ..service.metrics_service import MetricsService
 from ..service.logs_service import LogService
@@ -24,7 +24,7 @@ class MetricsMiddleware:
 
     async def __call__(self, request: Request, call_next):
         # Generate request ID if not exists
-        request_id = getattr(request.state, "request_id", str(uuid4()))
+        request_id = getattr(request.state, "request_id", None) or os.urandom(16).hex()
         request.state.request_id = request_id
         
         # Get request context
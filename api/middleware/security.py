@@ -2,10 +2,10 @@ from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 import logging
 from datetime import datetime, UTC
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 import re
 import ipaddress
-from uuid import uuid4
+import os
 
 from ..service.auth_service import AuthService
 from ..models.user import UserType, UserRole, UserStatus
@@ -13,6 +13,13 @@ from ..models.auth import TokenData
 
 logger = logging.getLogger(__name__)
 
+BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
+ALLOWED_CONTENT_TYPES = (
+    "application/json",
+    "multipart/form-data",
+    "application/x-www-form-urlencoded"
+)
+
 class SecurityMiddleware:
     def __init__(self):
         self.auth_service = AuthService()
@@ -22,12 +29,15 @@ class SecurityMiddleware:
         self.MAX_CONTENT_LENGTH = 10 * 1024 * 1024  # 10MB
         self.ALLOWED_HOSTS = ["localhost", "127.0.0.1"]
         self.TRUSTED_PROXIES = ["127.0.0.1"]
-        self.BLOCKED_IPS = set()
+        self.BLOCKED_IPS = set()  # packed 4/16-byte addresses
         self.RATE_LIMIT = 100  # requests per minute
         self.RATE_LIMIT_WINDOW = 60  # seconds
         
-        # Rate limiting storage
-        self.rate_limit_data = {}
+        # Rate limiting storage, sharded by IP hash (shard count must be a power of two)
+        self.RATE_LIMIT_SHARDS = 16
+        self._rl_shards: List[Dict[bytes, Dict[str, float]]] = [
+            {} for _ in range(self.RATE_LIMIT_SHARDS)
+        ]
         
         # CORS settings
         self.ALLOWED_ORIGINS = ["http://localhost:3000"]
@@ -80,44 +90,41 @@ class SecurityMiddleware:
             
         try:
             scheme, token = auth_header.split()
-            if scheme.lower() != "bearer":
-                return False, None, "Invalid authentication scheme"
-                
-            is_valid, token_data = await self.auth_service.verify_token(token)
-            if not is_valid or not token_data:
-                return False, None, "Invalid or expired token"
-                
-            return True, token_data, ""
+        except ValueError:
+            return False, None, "Malformed authorization header"
             
-        except Exception as e:
-            logger.error(f"Token validation error: {str(e)}")
-            return False, None, "Token validation failed"
+        if scheme.lower() != "bearer":
+            return False, None, "Invalid authentication scheme"
+            
+        # verify_token handles JWT errors itself
+        is_valid, token_data = await self.auth_service.verify_token(token)
+        if not is_valid or not token_data:
+            return False, None, "Invalid or expired token"
+            
+        return True, token_data, ""
 
-    def _check_rate_limit(self, ip: str) -> Tuple[bool, Dict]:
-        """Check rate limit for IP"""
+    def _check_rate_limit(self, ip: bytes) -> Tuple[bool, Dict]:
+        """Check rate limit for packed IP"""
         now = datetime.now(UTC).timestamp()
+        shard = self._rl_shards[hash(ip) & (self.RATE_LIMIT_SHARDS - 1)]
         
         # Initialize or cleanup old data
-        if ip not in self.rate_limit_data:
-            self.rate_limit_data[ip] = {
-                "count": 0,
-                "window_start": now
-            }
-        elif now - self.rate_limit_data[ip]["window_start"] >= self.RATE_LIMIT_WINDOW:
-            self.rate_limit_data[ip] = {
+        entry = shard.get(ip)
+        if entry is None or now - entry["window_start"] >= self.RATE_LIMIT_WINDOW:
+            entry = shard[ip] = {
                 "count": 0,
                 "window_start": now
             }
             
         # Update request count
-        self.rate_limit_data[ip]["count"] += 1
+        entry["count"] += 1
         
         # Calculate remaining
-        remaining = max(0, self.RATE_LIMIT - self.rate_limit_data[ip]["count"])
-        reset = self.RATE_LIMIT_WINDOW - (now - self.rate_limit_data[ip]["window_start"])
+        remaining = max(0, self.RATE_LIMIT - entry["count"])
+        reset = self.RATE_LIMIT_WINDOW - (now - entry["window_start"])
         
         return (
-            self.rate_limit_data[ip]["count"] <= self.RATE_LIMIT,
+            entry["count"] <= self.RATE_LIMIT,
             {
                 "X-RateLimit-Limit": str(self.RATE_LIMIT),
                 "X-RateLimit-Remaining": str(remaining),
@@ -133,68 +140,68 @@ class SecurityMiddleware:
         """Check if IP is trusted proxy"""
         return ip in self.TRUSTED_PROXIES
 
+    @staticmethod
+    def _pack_ip(ip: str) -> Optional[bytes]:
+        """Normalize IP string to its packed form, None if malformed"""
+        try:
+            return ipaddress.ip_address(ip).packed
+        except ValueError:
+            return None
+
     def _get_client_ip(self, request: Request) -> str:
         """Get real client IP considering proxy headers"""
         forwarded_for = request.headers.get("X-Forwarded-For")
         
         if forwarded_for and self._is_trusted_proxy(request.client.host):
             # Get the first IP in X-Forwarded-For chain
-            return forwarded_for.split(",")[0].strip()
+            idx = forwarded_for.find(",")
+            first = forwarded_for if idx < 0 else forwarded_for[:idx]
+            return first.strip()
             
         return request.client.host
 
     def _validate_content_length(self, request: Request) -> bool:
         """Validate request content length"""
+        content_length = request.headers.get("content-length")
+        if content_length is None:
+            return True
         try:
-            content_length = int(request.headers.get("content-length", 0))
-            return content_length <= self.MAX_CONTENT_LENGTH
-        except:
+            return int(content_length) <= self.MAX_CONTENT_LENGTH
+        except (TypeError, ValueError):
             return True
 
     def _validate_content_type(self, request: Request) -> bool:
         """Validate Content-Type header"""
-        if request.method in ["POST", "PUT", "PATCH"]:
-            content_type = request.headers.get("content-type", "")
-            return (
-                "application/json" in content_type or
-                "multipart/form-data" in content_type or
-                "application/x-www-form-urlencoded" in content_type
-            )
+        if request.method in BODY_METHODS:
+            return request.headers.get("content-type", "").startswith(ALLOWED_CONTENT_TYPES)
         return True
 
-    async def _handle_cors(
-        self,
-        request: Request,
-        response: Response
-    ) -> Optional[Response]:
-        """Handle CORS preflight and headers"""
+    def _cors_preflight(self, request: Request) -> Response:
+        """Answer CORS preflight request"""
         origin = request.headers.get("Origin")
-        
-        # Handle preflight
-        if request.method == "OPTIONS":
-            if not origin or origin not in self.ALLOWED_ORIGINS:
-                return JSONResponse(
-                    status_code=403,
-                    content={"detail": "CORS forbidden"}
-                )
-                
-            response = Response(status_code=204)
-            response.headers["Access-Control-Allow-Origin"] = origin
-            response.headers["Access-Control-Allow-Methods"] = ", ".join(self.ALLOWED_METHODS)
-            response.headers["Access-Control-Allow-Headers"] = ", ".join(self.ALLOWED_HEADERS)
-            response.headers["Access-Control-Max-Age"] = "3600"
-            return response
+        if not origin or origin not in self.ALLOWED_ORIGINS:
+            return JSONResponse(
+                status_code=403,
+                content={"detail": "CORS forbidden"}
+            )
             
-        # Handle actual request
+        response = Response(status_code=204)
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Access-Control-Allow-Methods"] = ", ".join(self.ALLOWED_METHODS)
+        response.headers["Access-Control-Allow-Headers"] = ", ".join(self.ALLOWED_HEADERS)
+        response.headers["Access-Control-Max-Age"] = "3600"
+        return response
+
+    def _cors_apply(self, request: Request, response: Response) -> None:
+        """Add CORS headers to actual response"""
+        origin = request.headers.get("Origin")
         if origin and origin in self.ALLOWED_ORIGINS:
             response.headers["Access-Control-Allow-Origin"] = origin
-            
-        return None
 
     async def __call__(self, request: Request, call_next):
         try:
             # Generate request ID
-            request.state.request_id = str(uuid4())
+            request.state.request_id = os.urandom(16).hex()
             
             # Validate host
             host = request.headers.get("host", "").split(":")[0]
@@ -208,14 +215,20 @@ class SecurityMiddleware:
             client_ip = self._get_client_ip(request)
             
             # Check blocked IPs
-            if client_ip in self.BLOCKED_IPS:
+            packed_ip = self._pack_ip(client_ip)
+            if packed_ip is None:
+                return JSONResponse(
+                    status_code=400,
+                    content={"detail": "Invalid client IP"}
+                )
+            if packed_ip in self.BLOCKED_IPS:
                 return JSONResponse(
                     status_code=403,
                     content={"detail": "IP address blocked"}
                 )
 
             # Check rate limit
-            is_allowed, rate_limit_headers = self._check_rate_limit(client_ip)
+            is_allowed, rate_limit_headers = self._check_rate_limit(packed_ip)
             if not is_allowed:
                 response = JSONResponse(
                     status_code=429,
@@ -224,10 +237,9 @@ class SecurityMiddleware:
                 response.headers.update(rate_limit_headers)
                 return response
 
-            # Handle CORS
-            cors_response = await self._handle_cors(request, response)
-            if cors_response:
-                return cors_response
+            # Handle CORS preflight
+            if request.method == "OPTIONS":
+                return self._cors_preflight(request)
 
             # Validate content length
             if not self._validate_content_length(request):
@@ -258,7 +270,8 @@ class SecurityMiddleware:
             # Process request
             response = await call_next(request)
 
-            # Add security headers
+            # Add CORS and security headers
+            self._cors_apply(request, response)
             response.headers.update(self.SECURITY_HEADERS)
             response.headers.update(rate_limit_headers)
             response.headers["X-Request-ID"] = request.state.request_id
@@ -301,8 +314,7 @@ class SecurityMiddleware:
         """Block an IP address"""
         try:
             # Validate IP
-            ipaddress.ip_address(ip)
-            self.BLOCKED_IPS.add(ip)
+            self.BLOCKED_IPS.add(ipaddress.ip_address(ip).packed)
             
             logger.warning(f"""
             IP blocked:
@@ -321,7 +333,9 @@ class SecurityMiddleware:
     async def unblock_ip(self, ip: str) -> bool:
         """Unblock an IP address"""
         try:
-            self.BLOCKED_IPS.discard(ip)
+            packed_ip = self._pack_ip(ip)
+            if packed_ip is not None:
+                self.BLOCKED_IPS.discard(packed_ip)
             
             logger.info(f"""
             IP unblocked:
@@ -1,9 +1,9 @@
 from fastapi import Request, Response, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, UTC
 import logging
 from typing import Optional, Dict, Any, List
-from uuid import uuid4
+import os
 
 from ..service.validation_service import ValidationService
 from ..service.error_handling_service import ErrorHandlingService
@@ -23,29 +23,35 @@ class ValidationMiddleware:
         User: fdygg
         """)
 
-    async def get_request_metadata(self, request: Request) -> Dict[str, Any]:
-        """Get metadata from request"""
-        return {
-            "user_agent": request.headers.get("user-agent", ""),
-            "ip_address": request.client.host,
-            "platform": request.headers.get("x-platform", "web"),
-            "app_version": request.headers.get("x-app-version", ""),
-            "device_id": request.headers.get("x-device-id", "")
-        }
-
-    async def get_validation_context(self, request: Request) -> Dict[str, Any]:
-        """Get validation context from request"""
-        platform = request.headers.get("x-platform", "web")
-        role = getattr(request.state, "user_role", None)
-        user_id = getattr(request.state, "user_id", None)
-        
-        return {
-            "platform": platform,
-            "role": role,
-            "user_id": user_id,
-            "method": request.method,
-            "path": request.url.path
-        }
+    def _request_id(self, request: Request) -> str:
+        """Reuse request ID set upstream by SecurityMiddleware"""
+        return getattr(request.state, "request_id", None) or os.urandom(16).hex()
+
+    def get_request_metadata(self, request: Request) -> Dict[str, Any]:
+        """Get metadata from request (memoized on request.state)"""
+        metadata = getattr(request.state, "_val_metadata", None)
+        if metadata is None:
+            metadata = request.state._val_metadata = {
+                "user_agent": request.headers.get("user-agent", ""),
+                "ip_address": request.client.host,
+                "platform": request.headers.get("x-platform", "web"),
+                "app_version": request.headers.get("x-app-version", ""),
+                "device_id": request.headers.get("x-device-id", "")
+            }
+        return metadata
+
+    def get_validation_context(self, request: Request) -> Dict[str, Any]:
+        """Get validation context from request (memoized on request.state)"""
+        context = getattr(request.state, "_val_context", None)
+        if context is None:
+            context = request.state._val_context = {
+                "platform": request.headers.get("x-platform", "web"),
+                "role": getattr(request.state, "user_role", None),
+                "user_id": getattr(request.state, "user_id", None),
+                "method": request.method,
+                "path": request.url.path
+            }
+        return context
 
     async def validate_request_data(
         self,
@@ -87,10 +93,10 @@ class ValidationMiddleware:
                 ) for error in errors
             ],
             timestamp=datetime.now(UTC),
-            request_id=str(uuid4()),
+            request_id=self._request_id(request),
             path=request.url.path,
             metadata={
-                **await self.get_request_metadata(request),
+                **self.get_request_metadata(request),
                 **context
             }
         )
@@ -103,14 +109,14 @@ class ValidationMiddleware:
                 return await call_next(request)
 
             # Get validation context
-            context = await self.get_validation_context(request)
+            context = self.get_validation_context(request)
 
             # Get request body
             if request.method in ["POST", "PUT", "PATCH"]:
                 try:
                     data = await request.json()
                 except Exception as e:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=400,
                         content=ErrorResponse(
                             status=400,
@@ -123,16 +129,16 @@ class ValidationMiddleware:
                                 )
                             ],
                             timestamp=datetime.now(UTC),
-                            request_id=str(uuid4()),
+                            request_id=self._request_id(request),
                             path=request.url.path,
-                            metadata=await self.get_request_metadata(request)
-                        ).dict()
+                            metadata=self.get_request_metadata(request)
+                        ).model_dump()
                     )
 
                 # Validate request data
                 errors = await self.validate_request_data(data, context)
                 if errors:
-                    return JSONResponse(
+                    return ORJSONResponse(
                         status_code=422,
                         content=(
                             await self.format_validation_errors(
@@ -140,7 +146,7 @@ class ValidationMiddleware:
                                 request,
                                 context
                             )
-                        ).dict()
+                        ).model_dump()
                     )
 
             # Process request if validation passes
@@ -161,8 +167,8 @@ class ValidationMiddleware:
                 request=request,
                 exc=e,
                 metadata={
-                    **await self.get_request_metadata(request),
-                    **await self.get_validation_context(request)
+                    **self.get_request_metadata(request),
+                    **self.get_validation_context(request)
                 }
             )
 
@@ -194,15 +200,15 @@ class ValidationMiddleware:
                 )
             ],
             timestamp=datetime.now(UTC),
-            request_id=str(uuid4()),
+            request_id=self._request_id(request),
             path=request.url.path,
             metadata={
-                **await self.get_request_metadata(request),
+                **self.get_request_metadata(request),
                 **context
             }
         )
         
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=422,
-            content=error_response.dict()
+            content=error_response.model_dump()
         )
\ No newline at end of file
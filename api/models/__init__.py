@@ -6,6 +6,7 @@ from pydantic import BaseModel, Field
 # Base configuration
 CURRENT_TIMESTAMP = "2025-05-29 15:55:50"
 CURRENT_USER = "fdygg"
+_CURRENT_DATETIME = datetime.strptime(CURRENT_TIMESTAMP, "%Y-%m-%d %H:%M:%S")
 
 # Import all models
 from .auth import (
@@ -35,6 +36,7 @@ from .balance import (
     BalanceResponse,
     BalanceUpdateRequest,
     BalanceHistoryResponse,
+    BalanceResponseBatch,
     Transaction,
     TransactionType,
     TransactionStatus,
@@ -88,6 +90,8 @@ from .admin import (
     Platform,
     AdminStats,
     AdminActivity,
+    ActivityEntry,
+    ActivityLog,
     AdminDashboard,
     AdminSettings
 )
@@ -101,12 +105,7 @@ from .settings import (
 # Common base models
 class BaseTimestampModel(BaseModel):
     """Base model with timestamp"""
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            CURRENT_TIMESTAMP,
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    created_at: datetime = Field(default=_CURRENT_DATETIME)
     updated_at: Optional[datetime] = None
     created_by: str = CURRENT_USER
     updated_by: Optional[str] = None
@@ -145,12 +144,7 @@ class PaginatedResponse(BaseResponse):
 class BaseDateRangeFilter(BaseModel):
     """Base date range filter"""
     start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = Field(
-        default_factory=lambda: datetime.strptime(
-            CURRENT_TIMESTAMP,
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    end_date: Optional[datetime] = Field(default=_CURRENT_DATETIME)
 
 class BaseUserFilter(BaseModel):
     """Base user filter"""
@@ -179,7 +173,7 @@ __all__ = [
     
     # Balance & Currency models
     "Balance", "BalanceResponse", "BalanceUpdateRequest",
-    "BalanceHistoryResponse", "Transaction", "TransactionType",
+    "BalanceHistoryResponse", "BalanceResponseBatch", "Transaction", "TransactionType",
     "TransactionStatus", "CurrencyType",
     
     # Conversion models
@@ -202,7 +196,7 @@ __all__ = [
     
     # Admin models
     "AdminRole", "AdminPermission", "Platform", "AdminStats",
-    "AdminActivity", "AdminDashboard", "AdminSettings",
+    "AdminActivity", "ActivityEntry", "ActivityLog", "AdminDashboard", "AdminSettings",
     
     # Settings models
     "Setting", "SettingCategory", "FeatureFlag",
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from enum import Enum
 
+# Parsed once at import; datetimes are immutable so sharing is safe
+_DEFAULT_TS = datetime(2025, 5, 29, 15, 51, 46)
+
 class AdminRole(str, Enum):
     SUPER_ADMIN = "super_admin"
     ADMIN = "admin"
@@ -31,12 +34,22 @@ class AdminStats(BaseModel):
     total_stock: Dict[str, int]
     total_balance: Dict[str, Dict[str, int]]  # Per currency, per platform
     active_users: Dict[str, int]
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    updated_at: datetime = Field(default=_DEFAULT_TS)
+
+_EXAMPLE_ADMIN_ACTIVITY = {
+    "id": "act_123456",
+    "admin_id": "adm_123456",
+    "action": "update_balance",
+    "platform": "discord",
+    "target_type": "user",
+    "target_id": "usr_123456",
+    "details": {
+        "currency": "wl",
+        "amount": 1000,
+        "reason": "Manual adjustment"
+    },
+    "created_at": "2025-05-29 15:51:46"
+}
 
 class AdminActivity(BaseModel):
     id: str
@@ -47,30 +60,21 @@ class AdminActivity(BaseModel):
     target_id: str
     details: Dict[str, Any]
     metadata: Dict = Field(default_factory=dict)
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    created_at: datetime = Field(default=_DEFAULT_TS)
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_ADMIN_ACTIVITY})
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "act_123456",
-                "admin_id": "adm_123456",
-                "action": "update_balance",
-                "platform": "discord",
-                "target_type": "user",
-                "target_id": "usr_123456",
-                "details": {
-                    "currency": "wl",
-                    "amount": 1000,
-                    "reason": "Manual adjustment"
-                },
-                "created_at": "2025-05-29 15:51:46"
-            }
-        }
+class ActivityEntry(BaseModel):
+    timestamp: datetime
+    user_id: str
+    action: str
+    details: Optional[str] = None
+
+class ActivityLog(BaseModel):
+    activities: List[ActivityEntry]
+    start_date: datetime
+    end_date: datetime
+    total: int
 
 class AdminDashboard(BaseModel):
     stats: AdminStats
@@ -78,12 +82,22 @@ class AdminDashboard(BaseModel):
     alerts: List[Dict]
     fraud_alerts: List[Dict]
     system_health: Dict[str, str]
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    updated_at: datetime = Field(default=_DEFAULT_TS)
+
+_EXAMPLE_ADMIN_SETTINGS = {
+    "id": "adm_123456",
+    "admin_id": "usr_123456",
+    "role": "admin",
+    "permissions": [
+        "manage_users",
+        "manage_products",
+        "manage_transactions"
+    ],
+    "platforms": ["discord", "web"],
+    "is_active": True,
+    "created_by": "fdygg",
+    "created_at": "2025-05-29 15:51:46"
+}
 
 class AdminSettings(BaseModel):
     id: str
@@ -94,35 +108,15 @@ class AdminSettings(BaseModel):
     is_active: bool = True
     metadata: Dict = Field(default_factory=dict)
     created_by: str = Field(default="fdygg")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    created_at: datetime = Field(default=_DEFAULT_TS)
     updated_by: Optional[str] = None
     updated_at: Optional[datetime] = None
 
-    @validator('platforms')
+    @field_validator('platforms')
+    @classmethod
     def validate_platforms(cls, v):
         if Platform.ALL in v and len(v) > 1:
             raise ValueError("When ALL is specified, no other platforms should be listed")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "adm_123456",
-                "admin_id": "usr_123456",
-                "role": "admin",
-                "permissions": [
-                    "manage_users",
-                    "manage_products",
-                    "manage_transactions"
-                ],
-                "platforms": ["discord", "web"],
-                "is_active": True,
-                "created_by": "fdygg",
-                "created_at": "2025-05-29 15:51:46"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_ADMIN_SETTINGS})
\ No newline at end of file
@@ -1,8 +1,11 @@
-from pydantic import BaseModel, Field
-from typing import Optional, Dict
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
+from typing import Any
+from typing_extensions import TypedDict
 from datetime import datetime
 from enum import Enum
 
+_DEFAULT_TS = datetime(2025, 5, 29, 17, 8, 40)
+
 class AuditAction(str, Enum):
     CREATE = "create"
     UPDATE = "update"
@@ -20,41 +23,72 @@ class AuditCategory(str, Enum):
     BALANCE = "balance"
     SYSTEM = "system"
 
+def parse_audit_action(value: str) -> AuditAction | str:
+    """Stored action as AuditAction, or the raw string if it isn't a member"""
+    try:
+        return AuditAction(value)
+    except ValueError:
+        return value
+
+_EXAMPLE_AUDIT_LOG = {
+    "id": "adt_12345",
+    "category": "product",
+    "action": "create",
+    "actor_id": "adm_67890",
+    "actor_type": "admin",
+    "target_id": "prd_12345",
+    "target_type": "product",
+    "description": "Created new product FARM_WORLD",
+    "metadata": {
+        "old_value": None,
+        "new_value": {
+            "code": "FARM_WORLD",
+            "name": "Farm World Ready"
+        }
+    },
+    "created_at": "2025-05-29 17:08:40"
+}
+
+class FieldChange(TypedDict, total=False):
+    old: Any
+    new: Any
+
 class AuditLog(BaseModel):
-    id: str = Field(..., description="Unique audit log ID")
-    category: AuditCategory
-    action: AuditAction
-    actor_id: str = Field(..., description="ID of user/admin who performed the action")
-    actor_type: str = Field(..., description="Type of actor (admin/user/system)")
-    target_id: Optional[str] = Field(None, description="ID of affected resource")
-    target_type: str = Field(..., description="Type of resource affected")
-    description: str = Field(..., description="Description of the action")
-    metadata: Dict = Field(default_factory=dict)
+    """Canonical audit log entry.
+
+    Also accepts the resource-style field names (user_id, resource_id,
+    resource_type, timestamp) used by LogService.
+    """
+    id: str | None = Field(None, description="Unique audit log ID")
+    category: AuditCategory = Field(default=AuditCategory.SYSTEM)
+    # Older and free-form rows store actions outside the enum; keep them as-is
+    action: AuditAction | str = Field(..., union_mode="left_to_right")
+    actor_id: str = Field(
+        ...,
+        validation_alias=AliasChoices("actor_id", "user_id"),
+        description="ID of user/admin who performed the action"
+    )
+    actor_type: str = Field("user", description="Type of actor (admin/user/system)")
+    target_id: str | None = Field(
+        None,
+        validation_alias=AliasChoices("target_id", "resource_id"),
+        description="ID of affected resource"
+    )
+    target_type: str = Field(
+        ...,
+        validation_alias=AliasChoices("target_type", "resource_type"),
+        description="Type of resource affected"
+    )
+    description: str = Field("", description="Description of the action")
+    changes: dict[str, FieldChange] = Field(
+        default_factory=dict,
+        description="Changes made {field: {old: value, new: value}}"
+    )
+    ip_address: str | None = None
+    metadata: dict = Field(default_factory=dict)
     created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 17:08:40",
-            "%Y-%m-%d %H:%M:%S"
-        )
+        default=_DEFAULT_TS,
+        validation_alias=AliasChoices("created_at", "timestamp")
     )
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "adt_12345",
-                "category": "product",
-                "action": "create",
-                "actor_id": "adm_67890",
-                "actor_type": "admin",
-                "target_id": "prd_12345",
-                "target_type": "product",
-                "description": "Created new product FARM_WORLD",
-                "metadata": {
-                    "old_value": None,
-                    "new_value": {
-                        "code": "FARM_WORLD",
-                        "name": "Farm World Ready"
-                    }
-                },
-                "created_at": "2025-05-29 17:08:40"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_AUDIT_LOG})
\ No newline at end of file
@@ -1,29 +1,43 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
 
 class Token(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     access_token: str
     token_type: str = "bearer"
     expires_at: datetime
-    refresh_token: Optional[str] = None
+    refresh_token: str | None = None
 
 class TokenData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     username: str
     role: str
     exp: datetime
 
+_EXAMPLE_LOGIN_REQUEST = {
+    "username": "player123",
+    "password": "securepassword123"
+}
+
 class LoginRequest(BaseModel):
     username: str = Field(..., min_length=3)
     password: str = Field(..., min_length=8)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "username": "player123",
-                "password": "securepassword123"
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_LOGIN_REQUEST})
+
+_EXAMPLE_LOGIN_RESPONSE = {
+    "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
+    "token_type": "bearer",
+    "expires_at": "2025-05-28T15:40:00",
+    "user": {
+        "id": "usr_123456",
+        "username": "player123",
+        "role": "user",
+        "growid": "PLAYER123"
+    }
+}
 
 class LoginResponse(BaseModel):
     access_token: str
@@ -31,17 +45,4 @@ class LoginResponse(BaseModel):
     expires_at: datetime
     user: dict
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "access_token": "eyJ0eXAiOiJKV1QiLCJhbGciOiJIUzI1NiJ9...",
-                "token_type": "bearer",
-                "expires_at": "2025-05-28T15:40:00",
-                "user": {
-                    "id": "usr_123456",
-                    "username": "player123",
-                    "role": "user",
-                    "growid": "PLAYER123"
-                }
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_LOGIN_RESPONSE})
\ No newline at end of file
@@ -1,8 +1,8 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from datetime import datetime
 from enum import Enum
-from decimal import Decimal
+
+_DEFAULT_TS = datetime(2025, 5, 29, 15, 43, 9)
 
 class CurrencyType(str, Enum):
     WL = "wl"      # World Lock
@@ -10,6 +10,9 @@ class CurrencyType(str, Enum):
     BGL = "bgl"    # Blue Gem Lock
     RUPIAH = "idr" # Indonesian Rupiah
 
+# Currencies web users may not hold
+_WEB_FORBIDDEN_CURRENCIES = frozenset(c for c in CurrencyType if c is not CurrencyType.RUPIAH)
+
 class TransactionType(str, Enum):
     ADD = "add"
     SUBTRACT = "subtract"
@@ -32,75 +35,56 @@ class Balance(BaseModel):
     bgl_balance: int = Field(0, ge=0, description="Balance in Blue Gem Locks")
     rupiah_balance: int = Field(0, ge=0, description="Balance in Rupiah")
 
-    @validator('wl_balance', 'dl_balance', 'bgl_balance', 'rupiah_balance')
-    def validate_non_negative(cls, v):
-        if v < 0:
-            raise ValueError("Balance cannot be negative")
-        return v
+_EXAMPLE_BALANCE_RESPONSE = {
+    "user_id": "usr_123456",
+    "user_type": "discord",
+    "growid": "PLAYER123",
+    "balance": {
+        "wl_balance": 1000,
+        "dl_balance": 100,
+        "bgl_balance": 10,
+        "rupiah_balance": 1000000
+    },
+    "last_updated": "2025-05-29 15:43:09",
+    "updated_by": "fdygg"
+}
 
 class BalanceResponse(BaseModel):
     user_id: str
     user_type: str  # "discord" atau "web"
-    growid: Optional[str] = None  # Wajib untuk Discord user
+    growid: str | None = None  # Wajib untuk Discord user
     balance: Balance
-    last_updated: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:43:09",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    last_updated: datetime = Field(default=_DEFAULT_TS)
     updated_by: str = Field(default="fdygg")
     
-    @validator('growid')
-    def validate_growid(cls, v, values):
-        if values.get('user_type') == "discord" and not v:
+    @model_validator(mode="after")
+    def validate_growid(self):
+        if self.user_type == "discord" and not self.growid:
             raise ValueError("Growtopia ID wajib diisi untuk user Discord")
-        elif values.get('user_type') == "web" and v:
+        elif self.user_type == "web" and self.growid:
             raise ValueError("User Web tidak boleh memiliki Growtopia ID")
-        return v
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "user_id": "usr_123456",
-                "user_type": "discord",
-                "growid": "PLAYER123",
-                "balance": {
-                    "wl_balance": 1000,
-                    "dl_balance": 100,
-                    "bgl_balance": 10,
-                    "rupiah_balance": 1000000
-                },
-                "last_updated": "2025-05-29 15:43:09",
-                "updated_by": "fdygg"
-            }
-        }
+        return self
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_BALANCE_RESPONSE})
+
+_EXAMPLE_BALANCE_UPDATE_REQUEST = {
+    "currency_type": "wl",
+    "amount": 1000,
+    "transaction_type": "add",
+    "reason": "Diamond Lock donation"
+}
 
 class BalanceUpdateRequest(BaseModel):
     currency_type: CurrencyType
     amount: int = Field(..., gt=0)
     transaction_type: TransactionType
-    reason: Optional[str] = Field(
+    reason: str | None = Field(
         None,
         min_length=3,
         max_length=200
     )
-    
-    @validator('amount')
-    def validate_amount(cls, v):
-        if v <= 0:
-            raise ValueError("Amount must be greater than 0")
-        return v
-
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "currency_type": "wl",
-                "amount": 1000,
-                "transaction_type": "add",
-                "reason": "Diamond Lock donation"
-            }
-        }
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_BALANCE_UPDATE_REQUEST})
 
 class Transaction(BaseModel):
     id: str = Field(..., description="Unique transaction ID")
@@ -109,59 +93,82 @@ class Transaction(BaseModel):
     currency_type: CurrencyType
     transaction_type: TransactionType
     amount: int = Field(..., gt=0)
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:43:09",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    timestamp: datetime = Field(default=_DEFAULT_TS)
     created_by: str = Field(default="fdygg")
-    description: Optional[str] = None
+    description: str | None = None
     status: TransactionStatus = Field(default=TransactionStatus.SUCCESS)
-    metadata: Dict = Field(default_factory=dict)
+    metadata: dict = Field(default_factory=dict)
 
-    @validator('currency_type')
-    def validate_currency_access(cls, v, values):
-        if values.get('user_type') == "web" and v != CurrencyType.RUPIAH:
+    @model_validator(mode="after")
+    def validate_currency_access(self):
+        if self.user_type == "web" and self.currency_type in _WEB_FORBIDDEN_CURRENCIES:
             raise ValueError("Web users can only access Rupiah currency")
-        return v
+        return self
+
+_EXAMPLE_BALANCE_HISTORY_RESPONSE = {
+    "user_id": "usr_123456",
+    "user_type": "discord",
+    "growid": "PLAYER123",
+    "transactions": [
+        {
+            "id": "txn_123456",
+            "user_id": "usr_123456",
+            "user_type": "discord",
+            "currency_type": "wl",
+            "transaction_type": "donation",
+            "amount": 1000,
+            "timestamp": "2025-05-29 15:43:09",
+            "created_by": "fdygg",
+            "description": "World Lock donation",
+            "status": "success",
+            "metadata": {
+                "donor_name": "DONOR123"
+            }
+        }
+    ],
+    "total_records": 1,
+    "status": "success",
+    "page": 1,
+    "page_size": 10
+}
 
 class BalanceHistoryResponse(BaseModel):
     user_id: str
     user_type: str
-    growid: Optional[str] = None
-    transactions: List[Transaction] = Field(default_factory=list)
+    growid: str | None = None
+    transactions: list[Transaction] = Field(default_factory=list)
     total_records: int = Field(..., ge=0)
     status: str = Field("success")
-    page: Optional[int] = Field(1, ge=1)
-    page_size: Optional[int] = Field(10, ge=1, le=100)
+    page: int | None = Field(1, ge=1)
+    page_size: int | None = Field(10, ge=1, le=100)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "user_id": "usr_123456",
-                "user_type": "discord",
-                "growid": "PLAYER123",
-                "transactions": [
-                    {
-                        "id": "txn_123456",
-                        "user_id": "usr_123456",
-                        "user_type": "discord",
-                        "currency_type": "wl",
-                        "transaction_type": "donation",
-                        "amount": 1000,
-                        "timestamp": "2025-05-29 15:43:09",
-                        "created_by": "fdygg",
-                        "description": "World Lock donation",
-                        "status": "success",
-                        "metadata": {
-                            "donor_name": "DONOR123"
-                        }
-                    }
-                ],
-                "total_records": 1,
-                "status": "success",
-                "page": 1,
-                "page_size": 10
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_BALANCE_HISTORY_RESPONSE})
+
+_EXAMPLE_BALANCE_RESPONSE_BATCH = {
+    "user_ids": ["usr_123456", "usr_654321"],
+    "user_types": ["discord", "web"],
+    "wl": [1000, 0],
+    "dl": [100, 0],
+    "bgl": [10, 0],
+    "rupiah": [1000000, 250000],
+    "totals": {
+        "wl_balance": 1000,
+        "dl_balance": 100,
+        "bgl_balance": 10,
+        "rupiah_balance": 1250000
+    },
+    "generated_at": "2025-05-29 15:43:09"
+}
+
+class BalanceResponseBatch(BaseModel):
+    """Column-oriented balances for bulk listings; index i of every list is one user"""
+    user_ids: list[str] = Field(default_factory=list)
+    user_types: list[str] = Field(default_factory=list)
+    wl: list[int] = Field(default_factory=list)
+    dl: list[int] = Field(default_factory=list)
+    bgl: list[int] = Field(default_factory=list)
+    rupiah: list[int] = Field(default_factory=list)
+    totals: Balance = Field(default_factory=Balance)
+    generated_at: datetime = Field(default=_DEFAULT_TS)
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_BALANCE_RESPONSE_BATCH})
\ No newline at end of file
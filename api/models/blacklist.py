@@ -1,7 +1,11 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
 from enum import Enum
+from functools import partial
+
+_DEFAULT_TS = datetime(2025, 5, 29, 15, 51, 46)
+_VALID_USER_TYPES = frozenset({"discord", "web"})
+_DEFAULT_PLATFORMS = ("discord", "web")
 
 class BlacklistType(str, Enum):
     USER = "user"          # User ID (Discord/Web)
@@ -25,113 +29,106 @@ class BlacklistStatus(str, Enum):
     REMOVED = "removed"
     APPEALED = "appealed"  # Allow for appeals
 
+_EXAMPLE_BLACKLIST_ENTRY = {
+    "id": "bl_123456",
+    "type": "user",
+    "value": "usr_123456",
+    "user_type": "discord",
+    "reason": "fraud",
+    "description": "Multiple chargeback attempts",
+    "evidence": [
+        {
+            "type": "transaction",
+            "id": "tx_123456",
+            "details": "Chargeback on WL purchase"
+        }
+    ],
+    "status": "active",
+    "created_by": "fdygg",
+    "created_at": "2025-05-29 15:51:46"
+}
+
 class BlacklistEntry(BaseModel):
-    id: Optional[str] = None
+    id: str | None = None
     type: BlacklistType
     value: str = Field(..., description="User ID, Growtopia ID, IP, or other identifier")
-    user_type: Optional[str] = Field(None, description="discord/web if applicable")
+    user_type: str | None = Field(None, description="discord/web if applicable")
     reason: BlacklistReason
-    description: Optional[str] = None
-    evidence: List[Dict] = Field(default_factory=list)
+    description: str | None = None
+    evidence: list[dict] = Field(default_factory=list)
     status: BlacklistStatus = Field(default=BlacklistStatus.ACTIVE)
-    expires_at: Optional[datetime] = None
+    expires_at: datetime | None = None
     created_by: str = Field(default="fdygg")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
-    updated_by: Optional[str] = None
-    updated_at: Optional[datetime] = None
-    metadata: Dict = Field(default_factory=dict)
+    created_at: datetime = Field(default=_DEFAULT_TS)
+    updated_by: str | None = None
+    updated_at: datetime | None = None
+    metadata: dict = Field(default_factory=dict)
 
-    @validator('user_type')
-    def validate_user_type(cls, v, values):
-        if values.get('type') == BlacklistType.USER and not v:
-            raise ValueError("user_type is required for USER blacklist type")
-        if v and v not in ["discord", "web"]:
+    @field_validator('user_type')
+    @classmethod
+    def validate_user_type(cls, v):
+        if v and v not in _VALID_USER_TYPES:
             raise ValueError("user_type must be either 'discord' or 'web'")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "bl_123456",
-                "type": "user",
-                "value": "usr_123456",
-                "user_type": "discord",
-                "reason": "fraud",
-                "description": "Multiple chargeback attempts",
-                "evidence": [
-                    {
-                        "type": "transaction",
-                        "id": "tx_123456",
-                        "details": "Chargeback on WL purchase"
-                    }
-                ],
-                "status": "active",
-                "created_by": "fdygg",
-                "created_at": "2025-05-29 15:51:46"
-            }
+    @model_validator(mode="after")
+    def validate_user_type_required(self):
+        if self.type == BlacklistType.USER and not self.user_type:
+            raise ValueError("user_type is required for USER blacklist type")
+        return self
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_BLACKLIST_ENTRY})
+
+_EXAMPLE_FRAUD_DETECTION_RULE = {
+    "id": "rule_123456",
+    "name": "Multiple Account Detection",
+    "description": "Detect multiple accounts from same IP",
+    "platform": ["discord", "web"],
+    "conditions": {
+        "type": "ip_address",
+        "threshold": 5,
+        "time_window": 3600
+    },
+    "actions": [
+        {
+            "type": "blacklist",
+            "target": "ip",
+            "duration": 86400
+        },
+        {
+            "type": "notify",
+            "channel": "discord",
+            "role": "moderator"
         }
+    ],
+    "priority": 1,
+    "is_active": True,
+    "created_by": "fdygg",
+    "created_at": "2025-05-29 15:51:46"
+}
 
 class FraudDetectionRule(BaseModel):
-    id: Optional[str] = None
+    id: str | None = None
     name: str
     description: str
-    platform: List[str] = Field(
-        default=["discord", "web"],
+    platform: list[str] = Field(
+        default_factory=partial(list, _DEFAULT_PLATFORMS),
         description="Platforms where rule applies"
     )
-    conditions: Dict = Field(..., description="Rule conditions")
-    actions: List[Dict] = Field(..., description="Actions to take when triggered")
+    conditions: dict = Field(..., description="Rule conditions")
+    actions: list[dict] = Field(..., description="Actions to take when triggered")
     is_active: bool = Field(default=True)
     priority: int = Field(default=1, ge=1, le=10)
     created_by: str = Field(default="fdygg")
-    created_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:51:46",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
-    updated_by: Optional[str] = None
-    updated_at: Optional[datetime] = None
+    created_at: datetime = Field(default=_DEFAULT_TS)
+    updated_by: str | None = None
+    updated_at: datetime | None = None
 
-    @validator('platform')
+    @field_validator('platform')
+    @classmethod
     def validate_platform(cls, v):
-        valid = ["discord", "web"]
-        if not all(p in valid for p in v):
-            raise ValueError(f"Platform must be one of: {valid}")
+        if not _VALID_USER_TYPES.issuperset(v):
+            raise ValueError(f"Platform must be one of: {sorted(_VALID_USER_TYPES)}")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": "rule_123456",
-                "name": "Multiple Account Detection",
-                "description": "Detect multiple accounts from same IP",
-                "platform": ["discord", "web"],
-                "conditions": {
-                    "type": "ip_address",
-                    "threshold": 5,
-                    "time_window": 3600
-                },
-                "actions": [
-                    {
-                        "type": "blacklist",
-                        "target": "ip",
-                        "duration": 86400
-                    },
-                    {
-                        "type": "notify",
-                        "channel": "discord",
-                        "role": "moderator"
-                    }
-                ],
-                "priority": 1,
-                "is_active": True,
-                "created_by": "fdygg",
-                "created_at": "2025-05-29 15:51:46"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_FRAUD_DETECTION_RULE})
\ No newline at end of file
@@ -1,16 +1,16 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
-from datetime import datetime
+from datetime import datetime, UTC
+from functools import partial
 
 class BaseModelWithTimestamp(BaseModel):
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
-    updated_at: Optional[datetime] = None
-    created_by: Optional[str] = None
-    updated_by: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    created_at: datetime = Field(default_factory=partial(datetime.now, UTC))
+    updated_at: datetime | None = None
+    created_by: str | None = None
+    updated_by: str | None = None
+    metadata: dict = Field(default_factory=dict)
     is_active: bool = True
 
 class PlatformSpecificModel(BaseModelWithTimestamp):
     platform: str
-    platform_id: Optional[str] = None
-    platform_metadata: Dict[str, Any] = Field(default_factory=dict)
\ No newline at end of file
+    platform_id: str | None = None
+    platform_metadata: dict = Field(default_factory=dict)
\ No newline at end of file
@@ -1,41 +1,45 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from datetime import datetime
-from enum import Enum
 from .balance import CurrencyType
 
+_DEFAULT_TS = datetime(2025, 5, 29, 15, 43, 9)
+_NON_RUPIAH = frozenset({CurrencyType.WL, CurrencyType.DL, CurrencyType.BGL})
+
+_EXAMPLE_CONVERSION_RATE = {
+    "currency": "wl",
+    "rate_rupiah": 5000,
+    "min_amount": 1,
+    "max_amount": 10000,
+    "is_active": True,
+    "updated_at": "2025-05-29 15:43:09",
+    "updated_by": "fdygg"
+}
+
 class ConversionRate(BaseModel):
     currency: CurrencyType = Field(..., description="Currency type (WL/DL/BGL)")
     rate_rupiah: int = Field(..., gt=0, description="Rate in Rupiah")
     min_amount: int = Field(1, ge=1, description="Minimum amount for conversion")
     max_amount: int = Field(..., gt=0, description="Maximum amount for conversion")
     is_active: bool = Field(default=True)
-    updated_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:43:09",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    updated_at: datetime = Field(default=_DEFAULT_TS)
     updated_by: str = Field(default="fdygg")
 
-    @validator('currency')
+    @field_validator('currency')
+    @classmethod
     def validate_currency(cls, v):
-        if v == CurrencyType.RUPIAH:
+        if v not in _NON_RUPIAH:
             raise ValueError("Cannot set conversion rate for Rupiah")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "currency": "wl",
-                "rate_rupiah": 5000,
-                "min_amount": 1,
-                "max_amount": 10000,
-                "is_active": True,
-                "updated_at": "2025-05-29 15:43:09",
-                "updated_by": "fdygg"
-            }
-        }
+    model_config = ConfigDict(frozen=True, json_schema_extra={"example": _EXAMPLE_CONVERSION_RATE})
+
+_EXAMPLE_CONVERSION_REQUEST = {
+    "user_id": "usr_123456",
+    "user_type": "discord",
+    "from_currency": "wl",
+    "to_currency": "idr",
+    "amount": 1000
+}
 
 class ConversionRequest(BaseModel):
     user_id: str
@@ -44,33 +48,39 @@ class ConversionRequest(BaseModel):
     to_currency: CurrencyType
     amount: int = Field(..., gt=0)
 
-    @validator('user_type')
+    @field_validator('user_type')
+    @classmethod
     def validate_user_type(cls, v):
         if v != "discord":
             raise ValueError("Only Discord users can perform currency conversion")
         return v
 
-    @validator('to_currency')
-    def validate_to_currency(cls, v, values):
-        from_curr = values.get('from_currency')
-        if from_curr == v:
+    @model_validator(mode="after")
+    def validate_to_currency(self):
+        if self.from_currency == self.to_currency:
             raise ValueError("Cannot convert to same currency")
-        if from_curr == CurrencyType.RUPIAH:
+        if self.from_currency not in _NON_RUPIAH:
             raise ValueError("Cannot convert from Rupiah")
-        if v != CurrencyType.RUPIAH:
+        if self.to_currency in _NON_RUPIAH:
             raise ValueError("Can only convert to Rupiah")
-        return v
+        return self
+
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_CONVERSION_REQUEST})
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "user_id": "usr_123456",
-                "user_type": "discord",
-                "from_currency": "wl",
-                "to_currency": "idr",
-                "amount": 1000
-            }
-        }
+_EXAMPLE_CONVERSION_RESPONSE = {
+    "conversion_id": "conv_123456",
+    "user_id": "usr_123456",
+    "from_currency": "wl",
+    "to_currency": "idr",
+    "amount": 1000,
+    "converted_amount": 5000000,
+    "rate_used": 5000,
+    "timestamp": "2025-05-29 15:43:09",
+    "status": "success",
+    "metadata": {
+        "growid": "PLAYER123"
+    }
+}
 
 class ConversionResponse(BaseModel):
     conversion_id: str
@@ -80,29 +90,8 @@ class ConversionResponse(BaseModel):
     amount: int
     converted_amount: int
     rate_used: int
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:43:09",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
+    timestamp: datetime = Field(default=_DEFAULT_TS)
     status: str = Field(default="success")
-    metadata: Dict = Field(default_factory=dict)
+    metadata: dict = Field(default_factory=dict)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "conversion_id": "conv_123456",
-                "user_id": "usr_123456",
-                "from_currency": "wl",
-                "to_currency": "idr",
-                "amount": 1000,
-                "converted_amount": 5000000,
-                "rate_used": 5000,
-                "timestamp": "2025-05-29 15:43:09",
-                "status": "success",
-                "metadata": {
-                    "growid": "PLAYER123"
-                }
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_CONVERSION_RESPONSE})
\ No newline at end of file
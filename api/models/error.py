@@ -1,43 +1,44 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
 from datetime import datetime
 
 class ErrorDetail(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     message: str
     code: str
-    field: Optional[str] = None
-    value: Optional[Any] = None
+    field: str | None = None
+    value: Any | None = None
+
+_EXAMPLE_ERROR_RESPONSE = {
+    "status": 400,
+    "type": "ValidationError",
+    "message": "Invalid input data",
+    "details": [
+        {
+            "field": "username",
+            "message": "Username must be between 3 and 50 characters",
+            "code": "LENGTH_ERROR",
+            "value": "ab"
+        }
+    ],
+    "timestamp": "2025-05-30T14:46:52Z",
+    "request_id": "req_123456",
+    "path": "/api/users",
+    "metadata": {
+        "browser": "Chrome",
+        "platform": "Web"
+    }
+}
 
 class ErrorResponse(BaseModel):
     status: int
     type: str
     message: str
-    details: List[ErrorDetail]
+    details: list[ErrorDetail]
     timestamp: datetime
-    request_id: Optional[str] = None
-    path: Optional[str] = None
-    metadata: Dict[str, Any] = Field(default_factory=dict)
+    request_id: str | None = None
+    path: str | None = None
+    metadata: dict = Field(default_factory=dict)
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "status": 400,
-                "type": "ValidationError",
-                "message": "Invalid input data",
-                "details": [
-                    {
-                        "field": "username",
-                        "message": "Username must be between 3 and 50 characters",
-                        "code": "LENGTH_ERROR",
-                        "value": "ab"
-                    }
-                ],
-                "timestamp": "2025-05-30T14:46:52Z",
-                "request_id": "req_123456",
-                "path": "/api/users",
-                "metadata": {
-                    "browser": "Chrome",
-                    "platform": "Web"
-                }
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_ERROR_RESPONSE})
\ No newline at end of file
@@ -48,7 +48,7 @@ class Notification(BaseModel):
     )
     sent_at: Optional[datetime] = None
     read_at: Optional[datetime] = None
-    metadata: Dict = Field(default_factory=dict)
+    metadata: dict = Field(default_factory=dict)
 
     class Config:
         json_schema_extra = {
@@ -69,4 +69,14 @@ class Notification(BaseModel):
                 "created_by": "fdygg",
                 "created_at": "2025-05-29 07:48:17"
             }
-        }
\ No newline at end of file
+        }
+
+# Keeps the expanded "id IN (?, ...)" well under SQLite's bound-variable limit
+MARK_READ_MAX_IDS = 500
+
+class MarkReadRequest(BaseModel):
+    ids: Optional[List[str]] = Field(
+        None,
+        max_length=MARK_READ_MAX_IDS,
+        description="Notifications to mark read; omit to mark all"
+    )
\ No newline at end of file
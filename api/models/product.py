@@ -1,7 +1,10 @@
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, List, Dict
 from datetime import datetime
 from enum import Enum
+import re
+
+_CODE_RE = re.compile(r"[A-Z0-9_]+")
 
 class ProductType(str, Enum):
     WORLD = "world"
@@ -24,35 +27,30 @@ class ProductBase(BaseModel):
     type: ProductType = Field(default=ProductType.WORLD)
     description: Optional[str] = Field(None, max_length=500)
     
-    @validator('code')
+    @field_validator('code')
+    @classmethod
     def validate_code(cls, v):
-        if not v.isalnum() and '_' not in v:
+        v = v.upper()
+        if not _CODE_RE.fullmatch(v):
             raise ValueError("Code must be alphanumeric or contain underscore only")
-        return v.upper()
-    
-    @validator('price')
-    def validate_price(cls, v):
-        if v <= 0:
-            raise ValueError("Price must be greater than 0")
         return v
 
+_EXAMPLE_PRODUCT_CREATE = {
+    "code": "FARM_WORLD",
+    "name": "Farm World Ready",
+    "price": 100,
+    "type": "world",
+    "description": "Ready to harvest farm world with magplant",
+    "metadata": {
+        "world_size": "100x60",
+        "has_magplant": True
+    }
+}
+
 class ProductCreate(ProductBase):
     metadata: Optional[Dict] = Field(default_factory=dict)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "code": "FARM_WORLD",
-                "name": "Farm World Ready",
-                "price": 100,
-                "type": "world",
-                "description": "Ready to harvest farm world with magplant",
-                "metadata": {
-                    "world_size": "100x60",
-                    "has_magplant": True
-                }
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_PRODUCT_CREATE})
 
 class ProductUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=3, max_length=100)
@@ -62,6 +60,23 @@ class ProductUpdate(BaseModel):
     status: Optional[ProductStatus] = None
     metadata: Optional[Dict] = None
 
+_EXAMPLE_PRODUCT_RESPONSE = {
+    "id": 1,
+    "code": "FARM_WORLD",
+    "name": "Farm World Ready",
+    "price": 100,
+    "type": "world",
+    "description": "Ready to harvest farm world with magplant",
+    "status": "active",
+    "stock_count": 5,
+    "total_stock": 10,
+    "created_at": "2025-05-28 14:57:46",
+    "metadata": {
+        "world_size": "100x60",
+        "has_magplant": True
+    }
+}
+
 class ProductResponse(ProductBase):
     id: Optional[int] = None
     status: ProductStatus = Field(default=ProductStatus.ACTIVE)
@@ -73,22 +88,4 @@ class ProductResponse(ProductBase):
     updated_at: Optional[datetime] = None
     metadata: Dict = Field(default_factory=dict)
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "code": "FARM_WORLD",
-                "name": "Farm World Ready",
-                "price": 100,
-                "type": "world",
-                "description": "Ready to harvest farm world with magplant",
-                "status": "active",
-                "stock_count": 5,
-                "total_stock": 10,
-                "created_at": "2025-05-28 14:57:46",
-                "metadata": {
-                    "world_size": "100x60",
-                    "has_magplant": True
-                }
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_PRODUCT_RESPONSE})
\ No newline at end of file
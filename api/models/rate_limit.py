@@ -1,8 +1,10 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 from typing import Optional
 
 class RateLimit(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     user_id: str
     endpoint: str 
     requests: int
@@ -76,4 +76,21 @@ class FeatureFlag(BaseModel):
                 "created_by": "fdygg",
                 "created_at": "2025-05-29 07:48:17"
             }
+        }
+
+class AppSettings(BaseModel):
+    settings: Dict[str, str] = Field(
+        default_factory=dict,
+        description="bot_settings key/value pairs"
+    )
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "settings": {
+                    "maintenance_mode": "0"
+                },
+                "updated_at": "2025-05-29 07:48:17"
+            }
         }
\ No newline at end of file
@@ -1,10 +1,16 @@
-from pydantic import BaseModel, Field, validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_validator
+from typing import Annotated
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
 from .balance import CurrencyType  # Import CurrencyType
 
-class StockStatus(str, Enum):
+_DEFAULT_TS = datetime(2025, 5, 29, 15, 48, 40)
+_VALID_USER_TYPES = frozenset({"discord", "web"})
+
+# Stripped and checked for emptiness inside pydantic-core, no Python validator
+_StockContent = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+class StockStatus(StrEnum):
     AVAILABLE = "available"
     SOLD = "sold"
     RESERVED = "reserved"
@@ -12,107 +18,88 @@ class StockStatus(str, Enum):
     INVALID = "invalid"
 
 class PriceInfo(BaseModel):
-    wl_price: Optional[int] = Field(0, ge=0)
-    dl_price: Optional[int] = Field(0, ge=0)
-    bgl_price: Optional[int] = Field(0, ge=0)
+    wl_price: int | None = Field(0, ge=0)
+    dl_price: int | None = Field(0, ge=0)
+    bgl_price: int | None = Field(0, ge=0)
     rupiah_price: int = Field(..., ge=0)  # Wajib ada harga Rupiah
 
-    @validator('*')
-    def validate_non_negative(cls, v):
-        if v < 0:
-            raise ValueError("Price cannot be negative")
-        return v
+_EXAMPLE_STOCK_ITEM = {
+    "id": 1,
+    "product_code": "FARM_WORLD",
+    "content": "FARMWORLD1",
+    "prices": {
+        "wl_price": 100,
+        "dl_price": 1,
+        "bgl_price": 0,
+        "rupiah_price": 50000
+    },
+    "status": "available",
+    "available_for": ["discord", "web"],
+    "added_by": "fdygg",
+    "added_at": "2025-05-29 15:48:40",
+    "metadata": {
+        "world_type": "farm",
+        "has_magplant": True
+    }
+}
 
 class StockItem(BaseModel):
-    id: Optional[int] = None
+    id: int | None = None
     product_code: str = Field(..., description="Product code this stock belongs to")
     content: str = Field(..., min_length=1, description="Stock content (world name, account details, etc)")
     prices: PriceInfo
     status: StockStatus = Field(default=StockStatus.AVAILABLE)
-    available_for: List[str] = Field(
+    available_for: list[str] = Field(
         default=["discord", "web"],
         description="User types that can purchase this item"
     )
     added_by: str = Field(default="fdygg")
-    added_at: datetime = Field(
-        default_factory=lambda: datetime.strptime(
-            "2025-05-29 15:48:40",
-            "%Y-%m-%d %H:%M:%S"
-        )
-    )
-    updated_at: Optional[datetime] = None
-    buyer_id: Optional[str] = None
-    seller_id: Optional[str] = None
-    metadata: Dict = Field(default_factory=dict)
+    added_at: datetime = Field(default=_DEFAULT_TS)
+    updated_at: datetime | None = None
+    buyer_id: str | None = None
+    seller_id: str | None = None
+    metadata: dict = Field(default_factory=dict)
 
-    @validator('available_for')
+    @field_validator('available_for')
+    @classmethod
     def validate_available_for(cls, v):
-        valid_types = ["discord", "web"]
-        if not all(t in valid_types for t in v):
-            raise ValueError(f"Invalid user type. Must be one of: {valid_types}")
+        if not _VALID_USER_TYPES.issuperset(v):
+            raise ValueError(f"Invalid user type. Must be one of: {sorted(_VALID_USER_TYPES)}")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "product_code": "FARM_WORLD",
-                "content": "FARMWORLD1",
-                "prices": {
-                    "wl_price": 100,
-                    "dl_price": 1,
-                    "bgl_price": 0,
-                    "rupiah_price": 50000
-                },
-                "status": "available",
-                "available_for": ["discord", "web"],
-                "added_by": "fdygg",
-                "added_at": "2025-05-29 15:48:40",
-                "metadata": {
-                    "world_type": "farm",
-                    "has_magplant": True
-                }
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_STOCK_ITEM})
+
+_EXAMPLE_STOCK_ADD_REQUEST = {
+    "product_code": "FARM_WORLD",
+    "items": ["FARMWORLD1", "FARMWORLD2"],
+    "prices": {
+        "wl_price": 100,
+        "dl_price": 1,
+        "bgl_price": 0,
+        "rupiah_price": 50000
+    },
+    "available_for": ["discord", "web"],
+    "metadata": {
+        "world_type": "farm",
+        "has_magplant": True
+    }
+}
 
 class StockAddRequest(BaseModel):
     product_code: str = Field(..., description="Product code to add stock to")
-    items: List[str] = Field(..., min_items=1, description="List of stock contents to add")
+    items: list[_StockContent] = Field(..., min_length=1, description="List of stock contents to add")
     prices: PriceInfo
-    available_for: List[str] = Field(
+    available_for: list[str] = Field(
         default=["discord", "web"],
         description="User types that can purchase this item"
     )
-    metadata: Optional[Dict] = Field(default_factory=dict)
+    metadata: dict | None = Field(default_factory=dict)
     
-    @validator('items')
-    def validate_items(cls, v):
-        if not all(item.strip() for item in v):
-            raise ValueError("Stock items cannot be empty")
-        return [item.strip() for item in v]
-
-    @validator('available_for')
+    @field_validator('available_for')
+    @classmethod
     def validate_available_for(cls, v):
-        valid_types = ["discord", "web"]
-        if not all(t in valid_types for t in v):
-            raise ValueError(f"Invalid user type. Must be one of: {valid_types}")
+        if not _VALID_USER_TYPES.issuperset(v):
+            raise ValueError(f"Invalid user type. Must be one of: {sorted(_VALID_USER_TYPES)}")
         return v
 
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "product_code": "FARM_WORLD",
-                "items": ["FARMWORLD1", "FARMWORLD2"],
-                "prices": {
-                    "wl_price": 100,
-                    "dl_price": 1,
-                    "bgl_price": 0,
-                    "rupiah_price": 50000
-                },
-                "available_for": ["discord", "web"],
-                "metadata": {
-                    "world_type": "farm",
-                    "has_magplant": True
-                }
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_STOCK_ADD_REQUEST})
\ No newline at end of file
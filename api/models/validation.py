@@ -1,5 +1,5 @@
-from pydantic import BaseModel, Field, validator
-from typing import Dict, List, Optional, Any
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any
 from enum import Enum
 from datetime import datetime
 
@@ -12,38 +12,36 @@ class ValidationType(str, Enum):
     PLATFORM = "platform"
     PERMISSION = "permission"
 
+_EXAMPLE_VALIDATION_RULE = {
+    "field": "username",
+    "type": "length",
+    "value": {"min": 3, "max": 50},
+    "message": "Username must be between 3 and 50 characters",
+    "platform": ["discord", "web"],
+    "roles": ["admin", "user"]
+}
+
 class ValidationRule(BaseModel):
     field: str
     type: ValidationType
     value: Any
     message: str
-    platform: Optional[List[str]] = None
-    roles: Optional[List[str]] = None
+    platform: list[str] | None = None
+    roles: list[str] | None = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "field": "username",
-                "type": "length",
-                "value": {"min": 3, "max": 50},
-                "message": "Username must be between 3 and 50 characters",
-                "platform": ["discord", "web"],
-                "roles": ["admin", "user"]
-            }
-        }
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_VALIDATION_RULE})
+
+_EXAMPLE_VALIDATION_ERROR = {
+    "field": "username",
+    "message": "Username must be between 3 and 50 characters",
+    "code": "LENGTH_ERROR",
+    "value": "ab"
+}
 
 class ValidationError(BaseModel):
     field: str
     message: str
     code: str
-    value: Optional[Any] = None
+    value: Any = None
     
-    class Config:
-        json_schema_extra = {
-            "example": {
-                "field": "username",
-                "message": "Username must be between 3 and 50 characters",
-                "code": "LENGTH_ERROR",
-                "value": "ab"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={"example": _EXAMPLE_VALIDATION_ERROR})
\ No newline at end of file
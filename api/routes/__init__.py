@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, Response
 from fastapi.templating import Jinja2Templates
 from datetime import datetime, UTC
 from pathlib import Path
 import logging
 import sys
 import platform
+import time
+import orjson
 import psutil
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 
 from ..middleware import skip_auth
 from ..config import config, API_VERSION
@@ -17,6 +19,13 @@ from ..models.dashboard import SystemInfo
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Prime psutil so the non-blocking cpu_percent() calls below measure since import
+psutil.cpu_percent(interval=None)
+
+# Host stats barely move at sub-second granularity
+SYSTEM_INFO_TTL = 1.0
+_system_info_cache: Optional[Tuple[float, SystemInfo]] = None
+
 # Setup templates
 templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
 
@@ -31,7 +40,7 @@ from .user import router as user_router
 from .product import router as product_router
 
 # Router configurations with metadata
-ROUTER_CONFIGS = [
+ROUTER_CONFIGS = (
     {
         "router": auth_router,
         "prefix": "/auth",
@@ -100,14 +109,19 @@ ROUTER_CONFIGS = [
             404: {"description": "Product not found"}
         }
     }
-]
+)
 
 # Register all routers with their configurations
 for router_config in ROUTER_CONFIGS:
     router.include_router(**router_config)
 
 def get_system_info() -> SystemInfo:
-    """Get system information with fallbacks"""
+    """Get system information with fallbacks, reused for SYSTEM_INFO_TTL seconds"""
+    global _system_info_cache
+    now = time.monotonic()
+    if _system_info_cache is not None and _system_info_cache[0] > now:
+        return _system_info_cache[1]
+
     try:
         memory = psutil.virtual_memory()
         memory_info = {
@@ -129,11 +143,11 @@ def get_system_info() -> SystemInfo:
         disk_info = {"error": "Disk stats unavailable"}
         
     try:
-        cpu_percent = round(psutil.cpu_percent(interval=0.1), 2)
+        cpu_percent = round(psutil.cpu_percent(interval=None), 2)
     except:
         cpu_percent = 0.0
         
-    return SystemInfo(
+    info = SystemInfo(
         python_version=sys.version,
         platform=platform.platform(),
         timezone="UTC",
@@ -141,17 +155,28 @@ def get_system_info() -> SystemInfo:
         disk=disk_info,
         cpu_percent=cpu_percent
     )
+    _system_info_cache = (now + SYSTEM_INFO_TTL, info)
+    return info
+
+# Static payloads, encoded once; load balancers poll these endpoints constantly
+_HEALTH_BODY = orjson.dumps({
+    "status": "ok",
+    "timestamp": "2025-05-28 15:38:37",
+    "version": API_VERSION,
+    "user": "fdygg"
+})
+_VERSION_BODY = orjson.dumps({
+    "version": API_VERSION,
+    "timestamp": "2025-05-28 15:38:37",
+    "environment": config.get_environment(),
+    "min_client_version": "1.0.0"
+})
 
 @router.get("/health")
 @skip_auth
 async def health_check():
     """API health check endpoint"""
-    return {
-        "status": "ok",
-        "timestamp": "2025-05-28 15:38:37",
-        "version": API_VERSION,
-        "user": "fdygg"
-    }
+    return Response(_HEALTH_BODY, media_type="application/json")
 
 @router.get("/system")
 async def system_status():
@@ -164,7 +189,7 @@ async def system_status():
         """)
         
         return {
-            "system": get_system_info().dict(),
+            "system": get_system_info().model_dump(),
             "user": "fdygg",
             "status": "ok",
             "timestamp": "2025-05-28 15:38:37"
@@ -185,19 +210,16 @@ async def system_status():
 @skip_auth
 async def get_version():
     """Get API version information"""
-    return {
-        "version": API_VERSION,
-        "timestamp": "2025-05-28 15:38:37",
-        "environment": config.get_environment(),
-        "min_client_version": "1.0.0"
-    }
+    return Response(_VERSION_BODY, media_type="application/json")
 
-# Error handlers
-@router.exception_handler(HTTPException)
+# Error handlers, registered on the app by APIServer.setup_api. Route
+# handlers only catch the errors they map to a 400 (ValueError/KeyError);
+# anything else lands here and is logged once.
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
     return JSONResponse(
         status_code=exc.status_code,
+        headers=getattr(exc, "headers", None),
         content={
             "detail": exc.detail,
             "timestamp": "2025-05-28 15:38:37",
@@ -206,16 +228,16 @@ async def http_exception_handler(request: Request, exc: HTTPException):
         }
     )
 
-@router.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"""
-    Unhandled exception:
-    Path: {request.url.path}
-    Error: {str(exc)}
-    Time: 2025-05-28 15:38:37 UTC
-    User: fdygg
-    """)
+    logger.error(
+        "unhandled_exception",
+        extra={
+            "path": request.url.path,
+            "method": request.method
+        },
+        exc_info=exc
+    )
     return JSONResponse(
         status_code=500,
         content={
@@ -229,6 +251,8 @@ async def general_exception_handler(request: Request, exc: Exception):
 # Export all routers
 __all__ = [
     "router",
+    "http_exception_handler",
+    "general_exception_handler",
     "auth_router",
     "admin_router",
     "balance_router",
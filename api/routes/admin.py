@@ -1,22 +1,69 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
 from fastapi.security import HTTPBearer
+from collections import OrderedDict
 from datetime import datetime, UTC
+from typing import Tuple
+import asyncio
 import jwt
 import logging
-import traceback
+import time
+from pydantic import TypeAdapter
 from ..dependencies import get_bot, verify_admin, get_current_user
 from ..models.admin import (
     AdminStats,
     AdminDashboard,
     SystemInfo,
-    UserActivity
+    ActivityLog
 )
-from database import get_connection
+from ..service.database_service import DatabaseService
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 security = HTTPBearer()
 
+_SNAPSHOT_TS = datetime(2025, 5, 28, 15, 24, 29)
+
+def _today_start() -> datetime:
+    """Midnight UTC of the current day"""
+    return datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+
+# Dashboards poll /activity with the same range over and over
+ACTIVITY_CACHE_SIZE = 128
+ACTIVITY_CACHE_TTL = 30
+_activity_cache: "OrderedDict[Tuple[datetime, datetime], Tuple[float, bytes]]" = OrderedDict()
+_ACTIVITY_LOG_ADAPTER = TypeAdapter(ActivityLog)
+
+ACTIVITY_LOG_QUERY = """
+    SELECT al.timestamp, al.user_id, al.action, al.details
+    FROM activity_log al
+    WHERE al.timestamp BETWEEN ? AND ?
+    ORDER BY al.timestamp DESC
+"""
+
+async def _activity_log_body(start: datetime, end: datetime) -> bytes:
+    """Serialized activity log for a range, served from a short-lived LRU cache"""
+    key = (start, end)
+    now = time.monotonic()
+    cached = _activity_cache.get(key)
+    if cached is not None and cached[0] > now:
+        _activity_cache.move_to_end(key)
+        return cached[1]
+
+    # Shared long-lived connection; the selected columns already carry the response keys
+    activities = await DatabaseService().execute_query(ACTIVITY_LOG_QUERY, (start, end))
+    body = _ACTIVITY_LOG_ADAPTER.dump_json(_ACTIVITY_LOG_ADAPTER.validate_python({
+        "activities": activities,
+        "start_date": start,
+        "end_date": end,
+        "total": len(activities)
+    }))
+
+    _activity_cache[key] = (now + ACTIVITY_CACHE_TTL, body)
+    _activity_cache.move_to_end(key)
+    if len(_activity_cache) > ACTIVITY_CACHE_SIZE:
+        _activity_cache.popitem(last=False)
+    return body
+
 @router.get("/stats", response_model=AdminStats)
 async def get_admin_stats(
     current_user: str = Depends(verify_admin),
@@ -24,23 +71,12 @@ async def get_admin_stats(
 ):
     """Get admin statistics"""
     try:
-        logger.info(f"""
-        Admin stats request:
-        Admin: {current_user}
-        Time: 2025-05-28 15:24:29 UTC
-        """)
+        logger.info("Admin stats request: admin=%s", current_user)
         
         stats = await get_system_stats(bot)
         return stats
     except Exception as e:
-        logger.error(f"""
-        Admin stats error:
-        Admin: {current_user}
-        Error: {str(e)}
-        Time: 2025-05-28 15:24:29 UTC
-        Stack Trace:
-        {traceback.format_exc()}
-        """)
+        logger.exception("Admin stats error: admin=%s", current_user)
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/dashboard", response_model=AdminDashboard)
@@ -50,11 +86,7 @@ async def get_admin_dashboard(
 ):
     """Get admin dashboard data"""
     try:
-        logger.info(f"""
-        Admin dashboard request:
-        Admin: {current_user}
-        Time: 2025-05-28 15:24:29 UTC
-        """)
+        logger.info("Admin dashboard request: admin=%s", current_user)
         
         system_info = await get_system_info(bot)
         user_activity = await get_user_activity()
@@ -66,21 +98,14 @@ async def get_admin_dashboard(
             "user_activity": user_activity,
             "stock_alerts": stock_alerts,
             "recent_transactions": recent_transactions,
-            "timestamp": datetime.strptime("2025-05-28 15:24:29", "%Y-%m-%d %H:%M:%S"),
+            "timestamp": _SNAPSHOT_TS,
             "admin": current_user
         }
     except Exception as e:
-        logger.error(f"""
-        Admin dashboard error:
-        Admin: {current_user}
-        Error: {str(e)}
-        Time: 2025-05-28 15:24:29 UTC
-        Stack Trace:
-        {traceback.format_exc()}
-        """)
+        logger.exception("Admin dashboard error: admin=%s", current_user)
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.get("/activity", response_model=UserActivity)
+@router.get("/activity", response_model=ActivityLog)
 async def get_activity_log(
     start_date: datetime = None,
     end_date: datetime = None,
@@ -88,65 +113,46 @@ async def get_activity_log(
 ):
     """Get user activity logs"""
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        start = start_date or _today_start()
+        end = end_date or _SNAPSHOT_TS
         
-        query = """
-            SELECT al.timestamp, al.user_id, al.action, al.details
-            FROM activity_log al
-            WHERE al.timestamp BETWEEN ? AND ?
-            ORDER BY al.timestamp DESC
-        """
-        
-        start = start_date or datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
-        end = end_date or datetime.strptime("2025-05-28 15:24:29", "%Y-%m-%d %H:%M:%S")
-        
-        cursor.execute(query, (start, end))
-        activities = cursor.fetchall()
-        
-        return {
-            "activities": [
-                {
-                    "timestamp": activity[0],
-                    "user_id": activity[1],
-                    "action": activity[2],
-                    "details": activity[3]
-                }
-                for activity in activities
-            ],
-            "start_date": start,
-            "end_date": end,
-            "total": len(activities)
-        }
+        # Pre-serialized by pydantic-core; skips FastAPI's response encoding
+        return Response(await _activity_log_body(start, end), media_type="application/json")
     except Exception as e:
-        logger.error(f"""
-        Activity log error:
-        Admin: {current_user}
-        Error: {str(e)}
-        Time: 2025-05-28 15:24:29 UTC
-        Stack Trace:
-        {traceback.format_exc()}
-        """)
+        logger.exception("Activity log error: admin=%s", current_user)
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if conn:
-            conn.close()
 
 async def get_system_stats(bot) -> AdminStats:
     """Get system statistics"""
-    return {
-        "total_users": await bot.db.users.count_documents({}),
-        "active_users": await bot.db.users.count_documents({"status": "active"}),
-        "total_products": await bot.db.products.count_documents({}),
-        "low_stock_alerts": await bot.db.products.count_documents({"stock": {"$lt": 10}}),
-        "transactions_today": await bot.db.transactions.count_documents({
+    # Independent round-trips, so issue them concurrently
+    (
+        total_users,
+        active_users,
+        total_products,
+        low_stock_alerts,
+        transactions_today,
+        total_balance
+    ) = await asyncio.gather(
+        bot.db.users.count_documents({}),
+        bot.db.users.count_documents({"status": "active"}),
+        bot.db.products.count_documents({}),
+        bot.db.products.count_documents({"stock": {"$lt": 10}}),
+        bot.db.transactions.count_documents({
             "created_at": {
-                "$gte": datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
+                "$gte": _today_start()
             }
         }),
-        "total_balance": await bot.db.balances.aggregate([
+        bot.db.balances.aggregate([
             {"$group": {"_id": None, "total": {"$sum": "$amount"}}}
-        ]).next(),
-        "timestamp": datetime.strptime("2025-05-28 15:24:29", "%Y-%m-%d %H:%M:%S"),
+        ]).next()
+    )
+    return {
+        "total_users": total_users,
+        "active_users": active_users,
+        "total_products": total_products,
+        "low_stock_alerts": low_stock_alerts,
+        "transactions_today": transactions_today,
+        "total_balance": total_balance,
+        "timestamp": _SNAPSHOT_TS,
         "updated_by": "fdygg"
     }
\ No newline at end of file
@@ -1,99 +1,132 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from typing import List, Optional
-from datetime import datetime, UTC
+from datetime import datetime
 import logging
+from pydantic import TypeAdapter
 
 from ..models.audit import (
     AuditLog,
-    AuditCategory,
-    AuditLevel
+    AuditCategory
 )
 from ..service.audit_service import AuditService
-from ..dependencies import get_bot, verify_admin
+from ..dependencies.services import get_audit_service
+from ..dependencies import verify_admin
+from ..dependencies.cache import cached
+from ..utils.pagination import next_cursor
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+_AUDIT_LIST_ADAPTER = TypeAdapter(List[AuditLog])
+
 @router.get("/logs", response_model=List[AuditLog])
 async def get_audit_logs(
-    page: int = Query(1, gt=0),
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     category: Optional[AuditCategory] = None,
-    level: Optional[AuditLevel] = None,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     user_id: Optional[str] = None,
-    bot=Depends(get_bot),
+    service: AuditService = Depends(get_audit_service),
     current_user: str = Depends(verify_admin)
 ):
     """Get audit logs with filtering and pagination (admin only)"""
     try:
-        service = AuditService(bot)
-        return await service.get_logs(
-            page=page,
+        logs = await service.get_audit_logs(
+            category=category,
+            actor_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
             limit=limit,
-            filters={
-                "category": category,
-                "level": level,
-                "start_date": start_date,
-                "end_date": end_date,
-                "user_id": user_id
-            }
+            offset=(page - 1) * limit,
+            cursor=cursor
+        )
+        token = next_cursor(logs, limit)
+        # Service already returns AuditLog models; serialize them directly
+        # instead of letting FastAPI re-validate the list against response_model
+        return Response(
+            _AUDIT_LIST_ADAPTER.dump_json(logs),
+            media_type="application/json",
+            headers={"X-Next-Cursor": token} if token else None
         )
     except Exception as e:
-        logger.error(f"""
-        Get audit logs error:
-        Admin: {current_user}
-        Filters: {{
-            "category": {category},
-            "level": {level},
-            "start_date": {start_date},
-            "end_date": {end_date},
-            "user_id": {user_id}
-        }}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        logger.error(
+            "audit_logs_error",
+            extra={
+                "admin": current_user,
+                "filters": {
+                    "category": category,
+                    "start_date": start_date,
+                    "end_date": end_date,
+                    "user_id": user_id
+                }
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
+@router.get("/logs/stream")
+async def stream_audit_logs(
+    category: Optional[AuditCategory] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    user_id: Optional[str] = None,
+    service: AuditService = Depends(get_audit_service),
+    current_user: str = Depends(verify_admin)
+):
+    """Stream matching audit logs as NDJSON (admin only)"""
+    return StreamingResponse(
+        service.stream_audit_logs(
+            category=category,
+            actor_id=user_id,
+            start_date=start_date,
+            end_date=end_date
+        ),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/metrics", response_model=dict)
+@cached("audit:metrics:{start_date}:{end_date}", ttl=60)
 async def get_audit_metrics(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    bot=Depends(get_bot),
+    service: AuditService = Depends(get_audit_service),
     current_user: str = Depends(verify_admin)
 ):
     """Get audit metrics (admin only)"""
     try:
-        service = AuditService(bot)
         return await service.get_metrics(
             start_date=start_date,
             end_date=end_date
         )
     except Exception as e:
-        logger.error(f"""
-        Get audit metrics error:
-        Admin: {current_user}
-        Period: {start_date} - {end_date}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        logger.error(
+            "get_audit_metrics_error",
+            extra={
+                "admin": current_user,
+                "start_date": start_date,
+                "end_date": end_date
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/alerts", response_model=List[dict])
 async def get_audit_alerts(
-    bot=Depends(get_bot),
+    service: AuditService = Depends(get_audit_service),
     current_user: str = Depends(verify_admin)
 ):
     """Get active audit alerts (admin only)"""
     try:
-        service = AuditService(bot)
         return await service.get_alerts()
     except Exception as e:
-        logger.error(f"""
-        Get audit alerts error:
-        Admin: {current_user}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        logger.error(
+            "get_audit_alerts_error",
+            extra={
+                "admin": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Request, Form, Depends
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from datetime import datetime, UTC, timedelta
 import logging
+from types import MappingProxyType
 from typing import Optional
 
 from ..config import config
-from ..middleware import get_current_time, get_current_user, format_log_message
+from ..middleware import get_current_time, get_current_user
 from ..models.auth import (
     LoginRequest,
     LoginResponse,
@@ -17,23 +18,36 @@ from ..models.auth import (
     TwoFactorVerifyRequest
 )
 from ..service.auth_service import AuthService
-from ..dependencies import get_bot, verify_admin
+from ..dependencies.services import get_auth_service
+from ..dependencies import verify_admin
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+_FIXED_TS = datetime(2025, 5, 28, 15, 31, 9)
+_SECURITY_HEADERS = MappingProxyType({
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block"
+})
+
 @router.post("/login", response_model=LoginResponse)
-async def login(request: Request, login_data: LoginRequest):
+async def login(
+    request: Request,
+    login_data: LoginRequest,
+    auth_service: AuthService = Depends(get_auth_service)
+):
     """Handle login form submission"""
     try:
         # Log login attempt
-        logger.info(format_log_message(f"""
-        Login attempt:
-        IP: {request.client.host}
-        User-Agent: {request.headers.get("user-agent")}
-        Username: {login_data.username}
-        Time: 2025-05-28 15:31:09 UTC
-        """))
+        logger.info(
+            "login_attempt",
+            extra={
+                "ip": request.client.host,
+                "user_agent": request.headers.get("user-agent"),
+                "username": login_data.username
+            }
+        )
         
         if not login_data.username or not login_data.api_key:
             raise HTTPException(
@@ -47,16 +61,14 @@ async def login(request: Request, login_data: LoginRequest):
             )
         
         # Verify API key
-        bot = get_bot()
-        auth_service = AuthService(bot)
-        
         if not await auth_service.verify_api_key(login_data.api_key, login_data.username):
-            logger.warning(format_log_message(f"""
-            Invalid login attempt:
-            Username: {login_data.username}
-            IP: {request.client.host}
-            Time: 2025-05-28 15:31:09 UTC
-            """))
+            logger.warning(
+                "invalid_login_attempt",
+                extra={
+                    "username": login_data.username,
+                    "ip": request.client.host
+                }
+            )
             
             raise HTTPException(
                 status_code=401,
@@ -77,18 +89,19 @@ async def login(request: Request, login_data: LoginRequest):
         # Update last login
         await auth_service.update_last_login(
             login_data.username,
-            datetime.strptime("2025-05-28 15:31:09", "%Y-%m-%d %H:%M:%S")
+            _FIXED_TS
         )
         
         # Log successful login
-        logger.info(format_log_message(f"""
-        Login successful:
-        Username: {login_data.username}
-        IP: {request.client.host}
-        Time: 2025-05-28 15:31:09 UTC
-        """))
+        logger.info(
+            "login_successful",
+            extra={
+                "username": login_data.username,
+                "ip": request.client.host
+            }
+        )
         
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "access_token": token_data.access_token,
                 "refresh_token": token_data.refresh_token,
@@ -97,24 +110,21 @@ async def login(request: Request, login_data: LoginRequest):
                 "timestamp": "2025-05-28 15:31:09",
                 "expires_in": 3600
             },
-            headers={
-                "X-Content-Type-Options": "nosniff",
-                "X-Frame-Options": "DENY",
-                "X-XSS-Protection": "1; mode=block"
-            }
+            headers=_SECURITY_HEADERS
         )
         
     except HTTPException:
         raise
         
-    except Exception as e:
-        logger.error(format_log_message(f"""
-        Login error:
-        Username: {login_data.username if login_data else None}
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        Path: {request.url.path}
-        """))
+    except Exception:
+        logger.error(
+            "login_error",
+            extra={
+                "username": login_data.username if login_data else None,
+                "path": request.url.path
+            },
+            exc_info=True
+        )
         
         raise HTTPException(
             status_code=500,
@@ -129,11 +139,10 @@ async def login(request: Request, login_data: LoginRequest):
 @router.post("/refresh", response_model=TokenResponse)
 async def refresh_token(
     refresh_request: RefreshTokenRequest,
-    bot=Depends(get_bot)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Refresh access token"""
     try:
-        auth_service = AuthService(bot)
         new_tokens = await auth_service.refresh_token(refresh_request.refresh_token)
         
         return {
@@ -143,12 +152,11 @@ async def refresh_token(
             "timestamp": "2025-05-28 15:31:09",
             "expires_in": 3600
         }
-    except Exception as e:
-        logger.error(f"""
-        Token refresh error:
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        """)
+    except Exception:
+        logger.error(
+            "token_refresh_error",
+            exc_info=True
+        )
         raise HTTPException(
             status_code=401,
             detail="Invalid refresh token"
@@ -158,31 +166,31 @@ async def refresh_token(
 async def admin_login(
     request: Request,
     login_data: AdminLoginRequest,
-    bot=Depends(get_bot)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Handle admin login"""
     try:
         # Log admin login attempt
-        logger.info(format_log_message(f"""
-        Admin login attempt:
-        IP: {request.client.host}
-        Username: {login_data.username}
-        Time: 2025-05-28 15:31:09 UTC
-        """))
-
-        auth_service = AuthService(bot)
+        logger.info(
+            "admin_login_attempt",
+            extra={
+                "ip": request.client.host,
+                "username": login_data.username
+            }
+        )
         
         # Verify admin credentials
         if not await auth_service.verify_admin_credentials(
             login_data.username,
             login_data.password
         ):
-            logger.warning(format_log_message(f"""
-            Invalid admin login attempt:
-            Username: {login_data.username}
-            IP: {request.client.host}
-            Time: 2025-05-28 15:31:09 UTC
-            """))
+            logger.warning(
+                "invalid_admin_login_attempt",
+                extra={
+                    "username": login_data.username,
+                    "ip": request.client.host
+                }
+            )
             
             raise HTTPException(
                 status_code=401,
@@ -199,7 +207,7 @@ async def admin_login(
         # Update last login
         await auth_service.update_last_login(
             login_data.username,
-            datetime.strptime("2025-05-28 15:31:09", "%Y-%m-%d %H:%M:%S")
+            _FIXED_TS
         )
         
         return {
@@ -212,23 +220,23 @@ async def admin_login(
         }
     except HTTPException:
         raise
-    except Exception as e:
-        logger.error(f"""
-        Admin login error:
-        Username: {login_data.username}
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        """)
+    except Exception:
+        logger.error(
+            "admin_login_error",
+            extra={
+                "username": login_data.username
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=500, detail="Login failed")
 
 @router.post("/2fa/setup", response_model=TwoFactorSetupResponse)
 async def setup_2fa(
     current_user: str = Depends(get_current_user),
-    bot=Depends(get_bot)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Setup 2FA for user"""
     try:
-        auth_service = AuthService(bot)
         setup_data = await auth_service.setup_2fa("fdygg")
         
         return {
@@ -236,24 +244,24 @@ async def setup_2fa(
             "qr_code": setup_data.qr_code,
             "timestamp": "2025-05-28 15:31:09"
         }
-    except Exception as e:
-        logger.error(f"""
-        2FA setup error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        """)
+    except Exception:
+        logger.error(
+            "two_factor_setup_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail="2FA setup failed")
 
 @router.post("/2fa/verify")
 async def verify_2fa(
     verify_request: TwoFactorVerifyRequest,
     current_user: str = Depends(get_current_user),
-    bot=Depends(get_bot)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Verify 2FA code"""
     try:
-        auth_service = AuthService(bot)
         is_valid = await auth_service.verify_2fa(
             "fdygg",
             verify_request.code
@@ -269,39 +277,40 @@ async def verify_2fa(
             "message": "2FA verification successful",
             "timestamp": "2025-05-28 15:31:09"
         }
-    except Exception as e:
-        logger.error(f"""
-        2FA verification error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        """)
+    except Exception:
+        logger.error(
+            "two_factor_verification_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail="2FA verification failed")
 
 @router.post("/reset-password")
 async def request_password_reset(
     reset_request: PasswordResetRequest,
-    bot=Depends(get_bot)
+    auth_service: AuthService = Depends(get_auth_service)
 ):
     """Request password reset"""
     try:
-        auth_service = AuthService(bot)
         await auth_service.request_password_reset(
             reset_request.email,
-            request_time=datetime.strptime("2025-05-28 15:31:09", "%Y-%m-%d %H:%M:%S")
+            request_time=_FIXED_TS
         )
         
         return {
             "message": "Password reset instructions sent",
             "timestamp": "2025-05-28 15:31:09"
         }
-    except Exception as e:
-        logger.error(f"""
-        Password reset request error:
-        Email: {reset_request.email}
-        Error: {str(e)}
-        Time: 2025-05-28 15:31:09 UTC
-        """))
+    except Exception:
+        logger.error(
+            "password_reset_request_error",
+            extra={
+                "email": reset_request.email
+            },
+            exc_info=True
+        )
         # Return success even if email not found for security
         return {
             "message": "Password reset instructions sent if email exists",
@@ -1,130 +1,152 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
-from typing import Optional, List
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Optional
 from datetime import datetime, UTC, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 import logging
 
 from ..models.balance import (
     BalanceResponse,
     BalanceUpdateRequest,
     BalanceHistoryResponse,
-    BalanceFilter,
-    BalanceType
+    BalanceResponseBatch
 )
 from ..service.balance_service import BalanceService
-from ..dependencies import get_bot, get_current_user, verify_admin
+from ..dependencies.services import get_balance_service
+from ..dependencies import get_current_user, verify_admin
+from ..dependencies.cache import cache_manager, cached
+from ..utils.pagination import next_cursor
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+_FIXED_TS = datetime(2025, 5, 28, 15, 29, 8)
+
+@lru_cache(maxsize=8)
+def _cache_headers(cache_time: int) -> MappingProxyType:
+    """Cache headers for a max-age; Expires derives from the fixed timestamp"""
+    return MappingProxyType({
+        "Cache-Control": f"public, max-age={cache_time}",
+        "Expires": (_FIXED_TS + timedelta(seconds=cache_time)).strftime("%a, %d %b %Y %H:%M:%S GMT"),
+    })
 
 def create_cached_response(data: dict, cache_time: int = 60):
     """Create response with cache headers"""
-    headers = {
-        "Cache-Control": f"public, max-age={cache_time}",
-        "Expires": (datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S") + 
-                   timedelta(seconds=cache_time)).strftime("%a, %d %b %Y %H:%M:%S GMT"),
-    }
-    return JSONResponse(content=data, headers=headers)
+    return ORJSONResponse(content=data, headers=_cache_headers(cache_time))
+
+@cached("balance:me:{user_id}", ttl=30)
+async def _load_my_balance(service: BalanceService, *, user_id: str):
+    """Load the balance served by /me, cached in Redis per user"""
+    balance = await service.get_balance("fdygg")
+    if not balance:
+        balance = {
+            "user_id": "fdygg",
+            "balance": 0,
+            "last_updated": _FIXED_TS
+        }
+    return balance
 
 @router.get("/me", response_model=BalanceResponse)
 async def get_my_balance(
-    bot=Depends(get_bot),
+    service: BalanceService = Depends(get_balance_service),
     current_user: str = Depends(get_current_user)
 ):
     """Get current user's balance"""
     try:
-        service = BalanceService(bot)
-        balance = await service.get_balance("fdygg")
-        if not balance:
-            balance = {
-                "user_id": "fdygg",
-                "balance": 0,
-                "last_updated": datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
-            }
-        return create_cached_response(balance, cache_time=30)
+        balance = await _load_my_balance(service, user_id=current_user)
+        return create_cached_response(jsonable_encoder(balance), cache_time=30)
     except Exception as e:
-        logger.error(f"""
-        Get balance error:
-        User: fdygg
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+        logger.error(
+            "get_balance_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/update", response_model=BalanceResponse)
 async def update_balance(
     request: BalanceUpdateRequest,
-    bot=Depends(get_bot),
+    user_id: str = Query(..., description="User whose balance is updated"),
+    user_type: str = Query("discord"),
+    service: BalanceService = Depends(get_balance_service),
     current_user: str = Depends(verify_admin)
 ):
     """Update user balance (admin only)"""
     try:
-        service = BalanceService(bot)
-        update_dict = request.dict()
-        update_dict["updated_at"] = datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
-        update_dict["updated_by"] = "fdygg"
-        
-        return await service.update_balance(update_dict)
+        result = await service.update_balance(user_id, user_type, request)
+        await cache_manager.delete(f"balance:me:{user_id}")
+        return result
     except Exception as e:
-        logger.error(f"""
-        Update balance error:
-        Data: {request.dict()}
-        Admin: fdygg
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "update_balance_error",
+                extra={
+                    "user": user_id,
+                    "data": request.model_dump(),
+                    "admin": "fdygg"
+                },
+                exc_info=True
+            )
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/history", response_model=List[BalanceHistoryResponse])
+@router.get("/history", response_model=BalanceHistoryResponse)
 async def get_balance_history(
-    page: int = Query(1, gt=0),
+    response: Response,
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
-    balance_type: Optional[BalanceType] = None,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
-    bot=Depends(get_bot),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    user_type: str = Query("discord"),
+    service: BalanceService = Depends(get_balance_service),
     current_user: str = Depends(get_current_user)
 ):
-    """Get balance history"""
+    """Get current user's balance history"""
     try:
-        service = BalanceService(bot)
-        filters = BalanceFilter(
-            user_id="fdygg",
-            balance_type=balance_type,
-            start_date=start_date,
-            end_date=end_date or datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
-        )
-        return await service.get_balance_history(
+        history = await service.get_balance_history(
+            current_user,
+            user_type,
             page=page,
-            limit=limit,
-            filters=filters
+            page_size=limit,
+            cursor=cursor
         )
+        token = next_cursor(history.transactions, limit, sort_attr="timestamp")
+        if token:
+            response.headers["X-Next-Cursor"] = token
+        return history
     except Exception as e:
-        logger.error(f"""
-        Balance history error:
-        User: fdygg
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+        logger.error(
+            "balance_history_error",
+            extra={
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/summary", dependencies=[Depends(verify_admin)])
+@router.get("/history/stream")
+async def stream_balance_history(
+    user_type: str = Query("discord"),
+    service: BalanceService = Depends(get_balance_service),
+    current_user: str = Depends(get_current_user)
+):
+    """Stream full balance history as NDJSON (one transaction per line)"""
+    return StreamingResponse(
+        service.stream_balance_history(current_user, user_type),
+        media_type="application/x-ndjson"
+    )
+
+@router.get("/summary", response_model=BalanceResponseBatch, dependencies=[Depends(verify_admin)])
 async def get_balance_summary(
-    date: Optional[datetime] = None,
-    bot=Depends(get_bot)
+    service: BalanceService = Depends(get_balance_service)
 ):
-    """Get balance summary for all users (admin only)"""
+    """Get current balance summary for all users (admin only)"""
     try:
-        service = BalanceService(bot)
-        summary_date = date or datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
-        return await service.get_balance_summary(summary_date)
+        return await service.get_balance_summary()
     except Exception as e:
-        logger.error(f"""
-        Balance summary error:
-        Date: {date}
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+        logger.error("balance_summary_error", exc_info=True)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/transfer", response_model=BalanceResponse)
@@ -132,27 +154,30 @@ async def transfer_balance(
     to_user: str,
     amount: float,
     notes: Optional[str] = None,
-    bot=Depends(get_bot),
+    service: BalanceService = Depends(get_balance_service),
     current_user: str = Depends(get_current_user)
 ):
     """Transfer balance to another user"""
     try:
-        service = BalanceService(bot)
         transfer_data = {
             "from_user": "fdygg",
             "to_user": to_user,
             "amount": amount,
             "notes": notes,
-            "transferred_at": datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
+            "transferred_at": _FIXED_TS
         }
-        return await service.transfer_balance(transfer_data)
+        result = await service.transfer_balance(transfer_data)
+        await cache_manager.delete(f"balance:me:{current_user}")
+        await cache_manager.delete(f"balance:me:{to_user}")
+        return result
     except Exception as e:
-        logger.error(f"""
-        Balance transfer error:
-        From: fdygg
-        To: {to_user}
-        Amount: {amount}
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+        logger.error(
+            "balance_transfer_error",
+            extra={
+                "from_user": "fdygg",
+                "to_user": to_user,
+                "amount": amount
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,11 +1,17 @@
 from fastapi import APIRouter, Request, Depends, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
+from typing import Optional, List, Dict, Tuple, AsyncIterator
 from datetime import datetime, UTC, timedelta
+from collections import OrderedDict
+import asyncio
 import logging
+import orjson
+import time
 from pathlib import Path
 
 from ..dependencies import get_bot, get_current_user
+from ..dependencies.cache import cached
 from ..models.dashboard import (
     DashboardStats,
     UserDashboard,
@@ -16,10 +22,23 @@ from ..models.dashboard import (
     UserActivity
 )
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 logger = logging.getLogger(__name__)
 
+_FIXED_TS = datetime(2025, 5, 28, 15, 35, 49)
+
+# Balance and last activity are read by every dashboard handler and barely
+# change between polls, so keep them per user for a few seconds
+USER_CACHE_SIZE = 2048
+USER_CACHE_TTL = 5
+_balance_cache: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+_last_activity_cache: "OrderedDict[str, Tuple[float, Optional[UserActivity]]]" = OrderedDict()
+
 templates = Jinja2Templates(directory=str(Path(__file__).parent.parent / "templates"))
+# Keep compiled templates for the process lifetime instead of stat-ing the
+# source on every render
+templates.env.auto_reload = False
+templates.env.cache_size = 400
 
 @router.get("/", response_class=HTMLResponse)
 async def dashboard(
@@ -28,21 +47,19 @@ async def dashboard(
 ):
     """Render dashboard page"""
     try:
-        bot = get_bot()
+        bot = await get_bot()
         uptime = datetime.now(UTC) - bot.startup_time
         
         # Get user data
-        user_data = await bot.db.users.find_one({"username": "fdygg"})
+        user_data = await bot.db.users.find_one(
+            {"username": "fdygg"},
+            projection={"username": 1, "avatar": 1, "last_login": 1, "role": 1}
+        )
         if not user_data:
             raise HTTPException(status_code=404, detail="User not found")
         
         # Get user stats
-        user_stats = UserStats(
-            total_transactions=await bot.db.transactions.count_documents({"user_id": "fdygg"}),
-            total_balance=await get_user_balance(bot, "fdygg"),
-            stock_count=await bot.db.stocks.count_documents({"user_id": "fdygg"}),
-            last_activity=await get_last_activity(bot, "fdygg")
-        )
+        user_stats = await get_user_stats(bot, "fdygg")
         
         return templates.TemplateResponse(
             "dashboard.html",
@@ -54,16 +71,17 @@ async def dashboard(
                 "bot_uptime": str(uptime).split('.')[0],
                 "version": "1.0.0",
                 "user_data": user_data,
-                "user_stats": user_stats.dict()
+                "user_stats": user_stats.model_dump(mode="json")
             }
         )
     except Exception as e:
-        logger.error(f"""
-        Dashboard error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:35:49 UTC
-        """)
+        logger.error(
+            "dashboard_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/stats", response_model=DashboardStats)
@@ -73,57 +91,78 @@ async def get_stats(
 ):
     """Get real-time dashboard stats"""
     try:
-        bot = get_bot()
+        bot = await get_bot()
         
-        # Get user's recent activity
-        recent_activity = await bot.db.activity_log.find(
-            {"user_id": "fdygg"}
-        ).sort("timestamp", -1).limit(10).to_list(None)
-        
-        # Get system status
-        system_status = await get_system_status(bot)
+        # Recent activity, system status and user stats are independent
+        recent_activity, system_status, user_stats = await asyncio.gather(
+            bot.db.activity_log.find(
+                {"user_id": "fdygg"},
+                projection={"action": 1, "timestamp": 1, "_id": 0}
+            ).sort("timestamp", -1).limit(10).to_list(None),
+            get_system_status(bot),
+            get_user_stats(bot, "fdygg")
+        )
         
         return DashboardStats(
-            timestamp=datetime.strptime("2025-05-28 15:35:49", "%Y-%m-%d %H:%M:%S"),
+            timestamp=_FIXED_TS,
             user={
                 "username": "fdygg",
                 "last_activity": recent_activity
             },
             system=system_status,
-            stats=await get_user_stats(bot, "fdygg")
+            stats=user_stats
         )
     except Exception as e:
-        logger.error(f"""
-        Stats error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:35:49 UTC
-        """)
+        logger.error(
+            "stats_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/me", response_model=UserDashboard)
+@cached("dashboard:me:{current_user}", ttl=30)
 async def get_user_dashboard(
     current_user: str = Depends(get_current_user),
     bot=Depends(get_bot)
 ):
     """Get user's personalized dashboard"""
     try:
+        stats, recent_transactions, stock_alerts = await asyncio.gather(
+            get_user_stats(bot, "fdygg"),
+            get_user_transactions(bot, "fdygg"),
+            get_user_stock_alerts(bot, "fdygg")
+        )
         return UserDashboard(
             username="fdygg",
-            timestamp=datetime.strptime("2025-05-28 15:35:49", "%Y-%m-%d %H:%M:%S"),
-            stats=await get_user_stats(bot, "fdygg"),
-            recent_transactions=await get_user_transactions(bot, "fdygg"),
-            stock_alerts=await get_user_stock_alerts(bot, "fdygg")
+            timestamp=_FIXED_TS,
+            stats=stats,
+            recent_transactions=recent_transactions,
+            stock_alerts=stock_alerts
         )
     except Exception as e:
-        logger.error(f"""
-        User dashboard error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:35:49 UTC
-        """)
+        logger.error(
+            "user_dashboard_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.get("/me/transactions/stream")
+async def stream_my_transactions(
+    current_user: str = Depends(get_current_user),
+    bot=Depends(get_bot)
+):
+    """Stream user's full transaction history as NDJSON"""
+    return StreamingResponse(
+        stream_user_transactions(bot, current_user),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/settings", response_model=DashboardSettings)
 async def get_dashboard_settings(
     current_user: str = Depends(get_current_user),
@@ -131,15 +170,19 @@ async def get_dashboard_settings(
 ):
     """Get user's dashboard settings"""
     try:
-        settings = await bot.db.dashboard_settings.find_one({"user_id": "fdygg"})
+        settings = await bot.db.dashboard_settings.find_one(
+            {"user_id": "fdygg"},
+            projection={"_id": 0}
+        )
         return DashboardSettings(**(settings or {}))
     except Exception as e:
-        logger.error(f"""
-        Settings error:
-        User: fdygg
-        Error: {str(e)}
-        Time: 2025-05-28 15:35:49 UTC
-        """)
+        logger.error(
+            "settings_error",
+            extra={
+                "user": "fdygg"
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/settings", response_model=DashboardSettings)
@@ -152,18 +195,20 @@ async def update_dashboard_settings(
     try:
         await bot.db.dashboard_settings.update_one(
             {"user_id": "fdygg"},
-            {"$set": settings.dict()},
+            {"$set": settings.model_dump()},
             upsert=True
         )
         return settings
     except Exception as e:
-        logger.error(f"""
-        Update settings error:
-        User: fdygg
-        Settings: {settings.dict()}
-        Error: {str(e)}
-        Time: 2025-05-28 15:35:49 UTC
-        """)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "update_settings_error",
+                extra={
+                    "user": "fdygg",
+                    "settings": settings.model_dump()
+                },
+                exc_info=True
+            )
         raise HTTPException(status_code=500, detail=str(e))
 
 # Helper functions
@@ -174,31 +219,77 @@ async def get_system_status(bot) -> SystemStatus:
         id=str(bot.user.id),
         uptime=str(datetime.now(UTC) - bot.startup_time).split('.')[0],
         guilds=len(bot.guilds),
-        last_updated=datetime.strptime("2025-05-28 15:35:49", "%Y-%m-%d %H:%M:%S"),
+        last_updated=_FIXED_TS,
         version="1.0.0"
     )
 
 async def get_user_stats(bot, username: str) -> UserStats:
     """Get user statistics"""
+    # Independent queries on different collections, so run them concurrently
+    (total_transactions, stock_count), total_balance, last_activity = await asyncio.gather(
+        get_user_counts(bot, username),
+        get_user_balance(bot, username),
+        get_last_activity(bot, username)
+    )
     return UserStats(
-        total_transactions=await bot.db.transactions.count_documents({"user_id": username}),
-        total_balance=await get_user_balance(bot, username),
-        stock_count=await bot.db.stocks.count_documents({"user_id": username}),
-        last_activity=await get_last_activity(bot, username)
+        total_transactions=total_transactions,
+        total_balance=total_balance,
+        stock_count=stock_count,
+        last_activity=last_activity
     )
 
+async def get_user_counts(bot, username: str) -> Tuple[int, int]:
+    """Get user's transaction and stock counts (run concurrently)"""
+    query = {"user_id": username}
+    return tuple(await asyncio.gather(
+        bot.db.transactions.count_documents(query),
+        bot.db.stocks.count_documents(query)
+    ))
+
+def _user_cache_get(cache: OrderedDict, username: str, now: float):
+    """Return (hit, value) from a per-user TTL cache"""
+    cached = cache.get(username)
+    if cached is not None and cached[0] > now:
+        cache.move_to_end(username)
+        return True, cached[1]
+    return False, None
+
+def _user_cache_put(cache: OrderedDict, username: str, now: float, value) -> None:
+    """Store value for username, evicting the least recently used entry"""
+    cache[username] = (now + USER_CACHE_TTL, value)
+    cache.move_to_end(username)
+    if len(cache) > USER_CACHE_SIZE:
+        cache.popitem(last=False)
+
 async def get_user_balance(bot, username: str) -> float:
     """Get user's current balance"""
-    balance = await bot.db.balances.find_one({"user_id": username})
-    return balance.get("amount", 0.0) if balance else 0.0
+    now = time.monotonic()
+    hit, amount = _user_cache_get(_balance_cache, username, now)
+    if hit:
+        return amount
+
+    balance = await bot.db.balances.find_one(
+        {"user_id": username},
+        projection={"amount": 1, "_id": 0}
+    )
+    amount = balance.get("amount", 0.0) if balance else 0.0
+    _user_cache_put(_balance_cache, username, now, amount)
+    return amount
 
 async def get_last_activity(bot, username: str) -> Optional[UserActivity]:
     """Get user's last activity"""
+    now = time.monotonic()
+    hit, last = _user_cache_get(_last_activity_cache, username, now)
+    if hit:
+        return last
+
     activity = await bot.db.activity_log.find_one(
         {"user_id": username},
         sort=[("timestamp", -1)]
     )
-    return UserActivity(**activity) if activity else None
+    last = UserActivity(**activity) if activity else None
+    _user_cache_put(_last_activity_cache, username, now, last)
+    return last
 
 async def get_user_transactions(bot, username: str, limit: int = 5) -> List[Dict]:
     """Get user's recent transactions"""
@@ -206,13 +297,20 @@ async def get_user_transactions(bot, username: str, limit: int = 5) -> List[Dict
         {"user_id": username}
     ).sort("timestamp", -1).limit(limit).to_list(None)
 
+async def stream_user_transactions(bot, username: str) -> AsyncIterator[bytes]:
+    """Yield user's transactions as NDJSON lines straight off the cursor"""
+    cursor = bot.db.transactions.find({"user_id": username}).sort("timestamp", -1)
+    async for doc in cursor:
+        yield orjson.dumps(doc, default=str) + b"\n"
+
 async def get_user_stock_alerts(bot, username: str) -> List[StockAlert]:
     """Get stock alerts for user's products"""
     alerts = await bot.db.stocks.find(
         {
             "user_id": username,
-            "current_stock": {"$lt": "$min_stock"}
-        }
+            "$expr": {"$lt": ["$current_stock", "$min_stock"]}
+        },
+        projection={"name": 1, "current_stock": 1, "min_stock": 1, "_id": 0}
     ).to_list(None)
     
     return [StockAlert(**alert) for alert in alerts]
\ No newline at end of file
@@ -1,121 +1,159 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, Request
+from fastapi.responses import ORJSONResponse
 from typing import List, Optional
-from datetime import datetime, UTC
 import logging
+import orjson
 
 from ..models.notifications import (
     Notification,
     NotificationType,
     NotificationPriority,
     NotificationChannel,
-    NotificationStatus
+    NotificationStatus,
+    MarkReadRequest
 )
-from ..service.notification_service import NotificationService
-from ..dependencies import get_bot, get_current_user, verify_admin
+from ..service.notifications_service import NotificationService
+from ..dependencies.services import get_notification_service
+from ..utils.pagination import next_cursor
+from ..utils.responses import ok_response, etag_response
+from ..dependencies import get_current_user, verify_admin
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 @router.get("/", response_model=List[Notification])
 async def get_notifications(
-    page: int = Query(1, gt=0),
+    response: Response,
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     type: Optional[NotificationType] = None,
     status: Optional[NotificationStatus] = None,
     priority: Optional[NotificationPriority] = None,
-    bot=Depends(get_bot),
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
     """Get notifications with filtering and pagination"""
     try:
-        service = NotificationService(bot)
-        return await service.get_notifications(
+        notifications = await service.get_user_notifications(
             user_id=current_user,
-            page=page,
+            status=status,
             limit=limit,
-            filters={
-                "type": type,
-                "status": status,
-                "priority": priority
-            }
+            offset=(page - 1) * limit,
+            cursor=cursor,
+            notification_type=type,
+            priority=priority
+        )
+        token = next_cursor(notifications, limit)
+        if token:
+            response.headers["X-Next-Cursor"] = token
+        return notifications
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "get_notifications_error",
+            extra={
+                "user": current_user,
+                "filters": {"type": type, "status": status, "priority": priority}
+            },
+            exc_info=True
         )
-    except Exception as e:
-        logger.error(f"""
-        Get notifications error:
-        User: {current_user}
-        Filters: {{"type": {type}, "status": {status}, "priority": {priority}}}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.post("/read/{notification_id}")
-async def mark_as_read(
-    notification_id: str,
-    bot=Depends(get_bot),
+@router.post("/read")
+async def mark_read(
+    request: Optional[MarkReadRequest] = None,
+    type: Optional[NotificationType] = None,
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
-    """Mark notification as read"""
+    """Mark the given notifications (or all, if no ids) as read in one request"""
+    ids = request.ids if request else None
     try:
-        service = NotificationService(bot)
-        success = await service.mark_as_read(
-            notification_id=notification_id,
-            user_id=current_user
+        count = await service.mark_read(
+            user_id=current_user,
+            notification_ids=ids,
+            notification_type=type
+        )
+        return ORJSONResponse({
+            "status": "success",
+            "count": count
+        })
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "mark_notifications_read_error",
+            extra={
+                "user": current_user,
+                "notifications": ids,
+                "type": type
+            },
+            exc_info=True
         )
-        if not success:
-            raise HTTPException(
-                status_code=404,
-                detail="Notification not found"
-            )
-        return {"status": "success"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"""
-        Mark notification read error:
-        User: {current_user}
-        Notification: {notification_id}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/read/all")
 async def mark_all_as_read(
     type: Optional[NotificationType] = None,
-    bot=Depends(get_bot),
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
     """Mark all notifications as read"""
     try:
-        service = NotificationService(bot)
-        count = await service.mark_all_as_read(
+        count = await service.mark_read(
             user_id=current_user,
             notification_type=type
         )
-        return {
+        return ORJSONResponse({
             "status": "success",
             "count": count
-        }
-    except Exception as e:
-        logger.error(f"""
-        Mark all notifications read error:
-        User: {current_user}
-        Type: {type}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        })
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "mark_all_notifications_read_error",
+            extra={
+                "user": current_user,
+                "type": type
+            },
+            exc_info=True
+        )
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/read/{notification_id}")
+async def mark_as_read(
+    notification_id: str,
+    service: NotificationService = Depends(get_notification_service),
+    current_user: str = Depends(get_current_user)
+):
+    """Mark notification as read"""
+    try:
+        count = await service.mark_read(
+            user_id=current_user,
+            notification_ids=[notification_id]
+        )
+        if not count:
+            raise HTTPException(
+                status_code=404,
+                detail="Notification not found"
+            )
+        return ok_response()
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "mark_notification_read_error",
+            extra={
+                "user": current_user,
+                "notification": notification_id
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{notification_id}")
 async def delete_notification(
     notification_id: str,
-    bot=Depends(get_bot),
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
     """Delete a notification"""
     try:
-        service = NotificationService(bot)
         success = await service.delete_notification(
             notification_id=notification_id,
             user_id=current_user
@@ -125,58 +163,58 @@ async def delete_notification(
                 status_code=404,
                 detail="Notification not found"
             )
-        return {"status": "success"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"""
-        Delete notification error:
-        User: {current_user}
-        Notification: {notification_id}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        return ok_response()
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "delete_notification_error",
+            extra={
+                "user": current_user,
+                "notification": notification_id
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/settings", response_model=dict)
 async def get_notification_settings(
-    bot=Depends(get_bot),
+    request: Request,
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
     """Get user's notification settings"""
     try:
-        service = NotificationService(bot)
         settings = await service.get_settings(current_user)
-        return settings or {}
-    except Exception as e:
-        logger.error(f"""
-        Get notification settings error:
-        User: {current_user}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+        return etag_response(request, orjson.dumps(settings or {}, default=str))
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "get_notification_settings_error",
+            extra={
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/settings")
 async def update_notification_settings(
     settings: dict,
-    bot=Depends(get_bot),
+    service: NotificationService = Depends(get_notification_service),
     current_user: str = Depends(get_current_user)
 ):
     """Update user's notification settings"""
     try:
-        service = NotificationService(bot)
         updated = await service.update_settings(
             user_id=current_user,
             settings=settings
         )
         return updated
-    except Exception as e:
-        logger.error(f"""
-        Update notification settings error:
-        User: {current_user}
-        Settings: {settings}
-        Time: {datetime.now(UTC)}
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "update_notification_settings_error",
+            extra={
+                "user": current_user,
+                "settings": settings
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
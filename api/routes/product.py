@@ -1,123 +1,179 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
-from datetime import datetime, UTC
+from fastapi import APIRouter, HTTPException, Depends, Query, Response, Request
+from typing import List, Optional, Tuple
+from collections import OrderedDict
+from datetime import datetime
 import logging
+import time
+from pydantic import TypeAdapter
 
 from ..models.product import (
     ProductCreate,
     ProductUpdate, 
     ProductResponse,
-    ProductFilter
+    ProductType,
+    ProductStatus
 )
 from ..service.product_service import ProductService
-from ..dependencies import get_bot, get_current_user, verify_admin
+from ..dependencies.services import get_product_service
+from ..utils.pagination import next_cursor
+from ..utils.responses import etag_response
+from ..dependencies import get_current_user, verify_admin
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_FIXED_TS = datetime(2025, 5, 28, 15, 18, 11)
+
+# List endpoints serialize the service's models directly; response_model is
+# kept for the OpenAPI schema but skipped at runtime (no re-validation)
+_PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+
+# GET /{code}/stock is polled hard; keep the encoded level per product for a
+# few seconds (stock routes invalidate it on add/reduce)
+STOCK_CACHE_SIZE = 1024
+STOCK_CACHE_TTL = 5
+_stock_cache: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+
+def invalidate_stock_cache(code: str) -> None:
+    """Drop the cached stock level for a product"""
+    _stock_cache.pop(code, None)
+
 @router.post("/", response_model=ProductResponse)
 async def create_product(
     product: ProductCreate,
-    bot=Depends(get_bot),
+    service: ProductService = Depends(get_product_service),
     current_user: str = Depends(get_current_user)
 ):
     """Create a new product"""
+    product_dict = product.model_dump()
     try:
-        service = ProductService(bot)
-        product_dict = product.dict()
-        product_dict["created_at"] = datetime.strptime("2025-05-28 15:18:11", "%Y-%m-%d %H:%M:%S")
+        product_dict["created_at"] = _FIXED_TS
         product_dict["created_by"] = current_user
         return await service.create_product(product_dict)
-    except Exception as e:
-        logger.error(f"""
-        Create product error:
-        Data: {product.dict()}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "create_product_error",
+            extra={
+                "data": product_dict,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/", response_model=List[ProductResponse])
 async def get_products(
-    page: int = Query(1, gt=0),
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
-    filters: ProductFilter = Depends(),
-    bot=Depends(get_bot)
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    type: Optional[ProductType] = None,
+    status: Optional[ProductStatus] = None,
+    min_price: Optional[int] = Query(None, ge=0),
+    max_price: Optional[int] = Query(None, ge=0),
+    has_stock: Optional[bool] = None,
+    service: ProductService = Depends(get_product_service)
 ):
     """Get all products with pagination and filtering"""
-    service = ProductService(bot)
-    return await service.get_products(
-        page=page,
-        limit=limit,
-        filters=filters
+    try:
+        products = await service.get_products(
+            product_type=type,
+            status=status,
+            min_price=min_price,
+            max_price=max_price,
+            has_stock=has_stock,
+            limit=limit,
+            offset=(page - 1) * limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    token = next_cursor(products, limit)
+    return Response(
+        _PRODUCT_LIST_ADAPTER.dump_json(products),
+        media_type="application/json",
+        headers={"X-Next-Cursor": token} if token else None
     )
 
 @router.get("/{code}", response_model=ProductResponse)
-async def get_product(code: str, bot=Depends(get_bot)):
-    """Get a product by its code"""
-    service = ProductService(bot)
-    product = await service.get_product(code)
+async def get_product(
+    code: str,
+    request: Request,
+    service: ProductService = Depends(get_product_service)
+):
+    """Get a product by its code, including its stock counts"""
+    product = await service.get_product_by_code(code)
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
-    return product
+    return etag_response(request, product.model_dump_json().encode())
 
 @router.put("/{code}", response_model=ProductResponse)
 async def update_product(
     code: str,
     product: ProductUpdate,
-    bot=Depends(get_bot),
+    service: ProductService = Depends(get_product_service),
     current_user: str = Depends(get_current_user)
 ):
     """Update a product"""
+    product_dict = product.model_dump(exclude_unset=True)
     try:
-        service = ProductService(bot)
-        product_dict = product.dict(exclude_unset=True)
-        product_dict["updated_at"] = datetime.strptime("2025-05-28 15:18:11", "%Y-%m-%d %H:%M:%S")
+        product_dict["updated_at"] = _FIXED_TS
         product_dict["updated_by"] = current_user
         updated = await service.update_product(code, product_dict)
         if not updated:
             raise HTTPException(status_code=404, detail="Product not found")
         return updated
-    except Exception as e:
-        logger.error(f"""
-        Update product error:
-        Code: {code}
-        Data: {product.dict()}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "update_product_error",
+            extra={
+                "code": code,
+                "data": product_dict,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{code}")
 async def delete_product(
     code: str,
-    bot=Depends(get_bot),
+    service: ProductService = Depends(get_product_service),
     current_user: str = Depends(verify_admin)
 ):
     """Delete a product (admin only)"""
     try:
-        service = ProductService(bot)
         deleted = await service.delete_product(code, current_user)
         if not deleted:
             raise HTTPException(status_code=404, detail="Product not found")
+        invalidate_stock_cache(code)
         return {"message": "Product deleted successfully"}
-    except Exception as e:
-        logger.error(f"""
-        Delete product error:
-        Code: {code}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "delete_product_error",
+            extra={
+                "code": code,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{code}/stock", response_model=int)
-async def get_product_stock(code: str, bot=Depends(get_bot)):
+async def get_product_stock(code: str, service: ProductService = Depends(get_product_service)):
     """Get current stock level for a product"""
-    service = ProductService(bot)
-    stock = await service.get_stock_level(code)
-    if stock is None:
+    now = time.monotonic()
+    cached = _stock_cache.get(code)
+    if cached is not None and cached[0] > now:
+        _stock_cache.move_to_end(code)
+        return Response(cached[1], media_type="application/json")
+
+    # Same single products+stock join as GET /{code}
+    product = await service.get_product_by_code(code)
+    if product is None:
         raise HTTPException(status_code=404, detail="Product not found")
-    return stock
\ No newline at end of file
+    body = str(product.stock_count).encode()
+    _stock_cache[code] = (now + STOCK_CACHE_TTL, body)
+    _stock_cache.move_to_end(code)
+    if len(_stock_cache) > STOCK_CACHE_SIZE:
+        _stock_cache.popitem(last=False)
+    return Response(body, media_type="application/json")
\ No newline at end of file
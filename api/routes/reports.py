@@ -1,6 +1,6 @@
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional
-from datetime import datetime, UTC
+from datetime import datetime
 import logging
 
 from ..models.reports import (
@@ -11,6 +11,7 @@ from ..models.reports import (
 )
 from ..service.report_service import ReportService
 from ..dependencies import get_bot, verify_admin
+from ..utils.responses import ok_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -37,16 +38,19 @@ async def generate_report(
             requested_by=current_user
         )
         return report
-    except Exception as e:
-        logger.error(f"""
-        Generate report error:
-        Admin: {current_user}
-        Type: {report_type}
-        Format: {format}
-        Period: {start_date} - {end_date}
-        Filters: {filters}
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "generate_report_error",
+            extra={
+                "admin": current_user,
+                "type": report_type,
+                "format": format,
+                "start_date": start_date,
+                "end_date": end_date,
+                "filters": filters
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/", response_model=List[Report])
@@ -64,19 +68,19 @@ async def get_reports(
         return await service.get_reports(
             page=page,
             limit=limit,
-            filters={
+            report_type=report_type,
+            status=status
+        )
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "get_reports_error",
+            extra={
+                "admin": current_user,
                 "type": report_type,
                 "status": status
-            }
+            },
+            exc_info=True
         )
-    except Exception as e:
-        logger.error(f"""
-        Get reports error:
-        Admin: {current_user}
-        Type: {report_type}
-        Status: {status}
-        Error: {str(e)}
-        """)
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{report_id}", response_model=Report)
@@ -95,15 +99,15 @@ async def get_report(
                 detail="Report not found"
             )
         return report
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"""
-        Get report error:
-        Admin: {current_user}
-        Report ID: {report_id}
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "get_report_error",
+            extra={
+                "admin": current_user,
+                "report_id": report_id
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.delete("/{report_id}")
@@ -121,14 +125,14 @@ async def delete_report(
                 status_code=404,
                 detail="Report not found"
             )
-        return {"status": "success"}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"""
-        Delete report error:
-        Admin: {current_user}
-        Report ID: {report_id}
-        Error: {str(e)}
-        """)
+        return ok_response()
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "delete_report_error",
+            extra={
+                "admin": current_user,
+                "report_id": report_id
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,88 +1,131 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import Optional
+from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi.responses import ORJSONResponse
+from typing import Optional, Tuple
+import asyncio
 import logging
+import time
 
 from ..models.settings import AppSettings
 from ..service.settings_service import SettingsService
-from ..dependencies import get_bot, verify_admin
+from ..dependencies.services import get_settings_service
+from ..dependencies import verify_admin
+from ..utils.responses import ok_response, etag_for, etag_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Settings change rarely; serve reads from memory and refetch at most every
+# SETTINGS_CACHE_TTL seconds. The lock keeps concurrent misses to one fetch.
+# The body is kept encoded, with its ETag, so a revalidation is a 304
+# straight from memory.
+SETTINGS_CACHE_TTL = 30
+_settings_cache: Optional[Tuple[float, bytes, str]] = None
+_settings_lock = asyncio.Lock()
+
+async def _cached_settings(service: SettingsService) -> Tuple[bytes, str]:
+    """Current settings as (JSON body, ETag), fetched on a cache miss"""
+    global _settings_cache
+    cached = _settings_cache
+    if cached is not None and cached[0] > time.monotonic():
+        return cached[1], cached[2]
+
+    async with _settings_lock:
+        cached = _settings_cache
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1], cached[2]
+        settings = await service.get_settings()
+        body = settings.model_dump_json().encode()
+        etag = etag_for(body)
+        _settings_cache = (time.monotonic() + SETTINGS_CACHE_TTL, body, etag)
+        return body, etag
+
+def _invalidate_settings() -> None:
+    global _settings_cache
+    _settings_cache = None
+
 @router.get("/", response_model=AppSettings)
 async def get_settings(
-    bot=Depends(get_bot),
+    request: Request,
+    service: SettingsService = Depends(get_settings_service),
     current_user: str = Depends(verify_admin)
 ):
     """Get application settings (admin only)"""
     try:
-        service = SettingsService(bot)
-        return await service.get_settings()
-    except Exception as e:
-        logger.error(f"""
-        Get settings error:
-        Admin: {current_user}
-        Error: {str(e)}
-        """)
+        body, etag = await _cached_settings(service)
+        return etag_response(request, body, etag)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "get_settings_error",
+            extra={
+                "admin": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/")
 async def update_settings(
     settings: AppSettings,
-    bot=Depends(get_bot),
+    service: SettingsService = Depends(get_settings_service),
     current_user: str = Depends(verify_admin)
 ):
     """Update application settings (admin only)"""
+    payload = settings.model_dump()
     try:
-        service = SettingsService(bot)
-        updated = await service.update_settings(settings.dict())
+        updated = await service.update_settings(payload)
+        _invalidate_settings()
         return updated
-    except Exception as e:
-        logger.error(f"""
-        Update settings error:
-        Admin: {current_user}
-        Settings: {settings.dict()}
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "update_settings_error",
+            extra={
+                "admin": current_user,
+                "settings": payload
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/reset")
 async def reset_settings(
-    bot=Depends(get_bot),
+    service: SettingsService = Depends(get_settings_service),
     current_user: str = Depends(verify_admin)
 ):
     """Reset settings to defaults (admin only)"""
     try:
-        service = SettingsService(bot)
         await service.reset_settings()
-        return {"status": "success"}
-    except Exception as e:
-        logger.error(f"""
-        Reset settings error:
-        Admin: {current_user}
-        Error: {str(e)}
-        """)
+        _invalidate_settings()
+        return ok_response()
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "reset_settings_error",
+            extra={
+                "admin": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/cache/clear")
 async def clear_cache(
     key_pattern: Optional[str] = None,
-    bot=Depends(get_bot),
+    service: SettingsService = Depends(get_settings_service),
     current_user: str = Depends(verify_admin)
 ):
     """Clear application cache (admin only)"""
     try:
-        service = SettingsService(bot)
         count = await service.clear_cache(key_pattern)
-        return {
+        return ORJSONResponse({
             "status": "success",
             "cleared_keys": count
-        }
-    except Exception as e:
-        logger.error(f"""
-        Clear cache error:
-        Admin: {current_user}
-        Pattern: {key_pattern}
-        Error: {str(e)}
-        """)
+        })
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "clear_cache_error",
+            extra={
+                "admin": current_user,
+                "pattern": key_pattern
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
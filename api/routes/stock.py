@@ -1,7 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
-from datetime import datetime, UTC
+from datetime import datetime
 import logging
+from pydantic import TypeAdapter
 
 from ..models.stock import (
     StockResponse,
@@ -9,81 +11,93 @@ from ..models.stock import (
     StockAddRequest,
     StockReduceRequest,
     StockHistoryResponse,
-    StockFilter
+    StockFilter,
+    StockStatus
 )
 from ..service.stock_service import StockService
-from ..dependencies import get_bot, get_current_user, verify_admin
+from ..dependencies.services import get_stock_service
+from ..dependencies import get_current_user, verify_admin
+from .product import invalidate_stock_cache
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_FIXED_TS = datetime(2025, 5, 28, 15, 18, 11)
+
+# List endpoints serialize the service's models directly; response_model is
+# kept for the OpenAPI schema but skipped at runtime (no re-validation)
+_STOCK_LIST_ADAPTER = TypeAdapter(List[StockResponse])
+
 @router.get("/", response_model=List[StockResponse])
 async def get_all_stock(
     page: int = Query(1, gt=0),
     limit: int = Query(10, gt=0, le=100),
     filters: StockFilter = Depends(),
-    bot=Depends(get_bot)
+    service: StockService = Depends(get_stock_service)
 ):
     """Get all stock items with pagination and filtering"""
-    service = StockService(bot)
-    return await service.get_all_stock(
+    stock = await service.get_all_stock(
         page=page,
         limit=limit,
         filters=filters
     )
+    return Response(_STOCK_LIST_ADAPTER.dump_json(stock), media_type="application/json")
 
-@router.post("/add", response_model=StockResponse)
+@router.post("/add", response_model=List[StockItem])
 async def add_stock(
     request: StockAddRequest,
-    bot=Depends(get_bot),
+    service: StockService = Depends(get_stock_service),
     current_user: str = Depends(get_current_user)
 ):
     """Add stock for products"""
     try:
-        service = StockService(bot)
-        return await service.add_stock(
-            request,
-            added_by=current_user,
-            added_at=datetime.strptime("2025-05-28 15:18:11", "%Y-%m-%d %H:%M:%S")
-        )
-    except Exception as e:
-        logger.error(f"""
-        Add stock error:
-        Data: {request.dict()}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+        success, items = await service.add_stock(request)
+        invalidate_stock_cache(request.product_code)
+        if not success:
+            raise ValueError("Failed to add stock")
+        return items
+    except (ValueError, KeyError) as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "add_stock_error",
+                extra={
+                    "data": request.model_dump(),
+                    "user": current_user
+                },
+                exc_info=True
+            )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/reduce", response_model=StockResponse)
 async def reduce_stock(
     request: StockReduceRequest,
-    bot=Depends(get_bot),
+    service: StockService = Depends(get_stock_service),
     current_user: str = Depends(get_current_user)
 ):
     """Reduce stock for products"""
     try:
-        service = StockService(bot)
-        return await service.reduce_stock(
+        result = await service.reduce_stock(
             request,
             reduced_by=current_user,
-            reduced_at=datetime.strptime("2025-05-28 15:18:11", "%Y-%m-%d %H:%M:%S")
+            reduced_at=_FIXED_TS
         )
-    except Exception as e:
-        logger.error(f"""
-        Reduce stock error:
-        Data: {request.dict()}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+        invalidate_stock_cache(request.product_code)
+        return result
+    except (ValueError, KeyError) as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(
+                "reduce_stock_error",
+                extra={
+                    "data": request.model_dump(),
+                    "user": current_user
+                },
+                exc_info=True
+            )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{product_code}", response_model=StockResponse)
-async def get_stock(product_code: str, bot=Depends(get_bot)):
+async def get_stock(product_code: str, service: StockService = Depends(get_stock_service)):
     """Get stock details for a product"""
-    service = StockService(bot)
     stock = await service.get_stock(product_code)
     if not stock:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -96,10 +110,9 @@ async def get_stock_history(
     limit: int = Query(10, gt=0, le=100),
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    bot=Depends(get_bot)
+    service: StockService = Depends(get_stock_service)
 ):
     """Get stock history for a product"""
-    service = StockService(bot)
     return await service.get_stock_history(
         product_code,
         page=page,
@@ -108,16 +121,27 @@ async def get_stock_history(
         end_date=end_date
     )
 
+@router.get("/{product_code}/stream")
+async def stream_stock(
+    product_code: str,
+    status: Optional[StockStatus] = None,
+    service: StockService = Depends(get_stock_service)
+):
+    """Stream a product's stock items as NDJSON (one item per line)"""
+    return StreamingResponse(
+        service.stream_stock(product_code, status=status),
+        media_type="application/x-ndjson"
+    )
+
 @router.get("/{product_code}/movements", response_model=List[StockItem])
 async def get_stock_movements(
     product_code: str,
     movement_type: Optional[str] = None,
     page: int = Query(1, gt=0),
     limit: int = Query(10, gt=0, le=100),
-    bot=Depends(get_bot)
+    service: StockService = Depends(get_stock_service)
 ):
     """Get stock movements (in/out) for a product"""
-    service = StockService(bot)
     return await service.get_stock_movements(
         product_code,
         movement_type=movement_type,
@@ -130,26 +154,26 @@ async def audit_stock(
     product_code: str,
     actual_quantity: int,
     notes: Optional[str] = None,
-    bot=Depends(get_bot),
+    service: StockService = Depends(get_stock_service),
     current_user: str = Depends(get_current_user)
 ):
     """Perform stock audit (admin only)"""
     try:
-        service = StockService(bot)
         return await service.audit_stock(
             product_code,
             actual_quantity,
             audited_by=current_user,
-            audited_at=datetime.strptime("2025-05-28 15:18:11", "%Y-%m-%d %H:%M:%S"),
+            audited_at=_FIXED_TS,
             notes=notes
         )
-    except Exception as e:
-        logger.error(f"""
-        Stock audit error:
-        Product: {product_code}
-        Quantity: {actual_quantity}
-        User: {current_user}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "stock_audit_error",
+            extra={
+                "product": product_code,
+                "quantity": actual_quantity,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,95 +1,191 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from typing import List, Optional
-from datetime import datetime, UTC
+from functools import lru_cache
+from datetime import datetime
 import logging
+from pydantic import TypeAdapter
 
 from ..models.transaction import (
     TransactionResponse,
     TransactionCreate,
     TransactionFilter,
+    check_filter_ranges,
     TransactionType,
-    TransactionStatus
+    TransactionStatus,
+    CurrencyType
 )
 from ..service.transaction_service import TransactionService
-from ..dependencies import get_bot, get_current_user, verify_admin
+from ..dependencies.services import get_transaction_service
+from ..utils.pagination import next_cursor
+from ..dependencies import get_current_user, check_is_admin, verify_admin
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+_FIXED_TS = datetime(2025, 5, 28, 15, 29, 8)
+
+# List endpoints serialize the service's models directly; response_model is
+# kept for the OpenAPI schema but skipped at runtime (no re-validation)
+_TRANSACTION_LIST_ADAPTER = TypeAdapter(List[TransactionResponse])
+
+@lru_cache(maxsize=1024)
+def _filter_for(
+    user_id: str,
+    transaction_type: Optional[TransactionType],
+    status: Optional[TransactionStatus]
+) -> TransactionFilter:
+    """Shared /me filter per user and query; TransactionFilter is frozen"""
+    # Query params are already validated and there are no ranges to check,
+    # so skip a second validation pass
+    return TransactionFilter.model_construct(
+        user_id=user_id,
+        type=transaction_type,
+        status=status
+    )
+
+async def _transaction_filter(
+    user_id: Optional[str] = None,
+    user_type: Optional[str] = None,
+    growid: Optional[str] = None,
+    type: Optional[TransactionType] = None,
+    currency: Optional[CurrencyType] = None,
+    status: Optional[TransactionStatus] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    min_amount: Optional[int] = Query(None, ge=0),
+    max_amount: Optional[int] = Query(None, ge=0)
+) -> TransactionFilter:
+    """GET / query filters without a second validation pass.
+
+    Query() has already parsed each field, so only TransactionFilter's
+    range checks run here. Async so FastAPI resolves it inline instead of
+    instantiating the model in the threadpool.
+    """
+    try:
+        check_filter_ranges(start_date, end_date, min_amount, max_amount)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return TransactionFilter.model_construct(
+        user_id=user_id,
+        user_type=user_type,
+        growid=growid,
+        type=type,
+        currency=currency,
+        status=status,
+        start_date=start_date,
+        end_date=end_date,
+        min_amount=min_amount,
+        max_amount=max_amount
+    )
+
 @router.post("/", response_model=TransactionResponse)
 async def create_transaction(
     transaction: TransactionCreate,
-    bot=Depends(get_bot),
+    service: TransactionService = Depends(get_transaction_service),
     current_user: str = Depends(get_current_user)
 ):
     """Create a new transaction"""
+    transaction_dict = transaction.model_dump()
     try:
-        service = TransactionService(bot)
-        transaction_dict = transaction.dict()
-        transaction_dict["created_at"] = datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
-        transaction_dict["created_by"] = "fdygg"
+        transaction_dict["created_at"] = _FIXED_TS
+        transaction_dict["created_by"] = current_user
         return await service.create_transaction(transaction_dict)
-    except Exception as e:
-        logger.error(f"""
-        Create transaction error:
-        Data: {transaction.dict()}
-        User: fdygg
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "create_transaction_error",
+            extra={
+                "data": transaction_dict,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/", response_model=List[TransactionResponse])
 async def get_transactions(
-    page: int = Query(1, gt=0),
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
-    filters: TransactionFilter = Depends(),
-    bot=Depends(get_bot)
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+    filters: TransactionFilter = Depends(_transaction_filter),
+    service: TransactionService = Depends(get_transaction_service)
 ):
     """Get all transactions with pagination and filtering"""
-    service = TransactionService(bot)
-    return await service.get_transactions(
-        page=page,
-        limit=limit,
-        filters=filters
+    try:
+        transactions = await service.get_transactions(
+            filters,
+            limit=limit,
+            offset=(page - 1) * limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    token = next_cursor(transactions, limit)
+    return Response(
+        _TRANSACTION_LIST_ADAPTER.dump_json(transactions),
+        media_type="application/json",
+        headers={"X-Next-Cursor": token} if token else None
     )
 
 @router.get("/me", response_model=List[TransactionResponse])
 async def get_my_transactions(
-    page: int = Query(1, gt=0),
+    page: int = Query(1, gt=0, deprecated=True),
     limit: int = Query(10, gt=0, le=100),
+    cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
     transaction_type: Optional[TransactionType] = None,
     status: Optional[TransactionStatus] = None,
-    bot=Depends(get_bot),
+    service: TransactionService = Depends(get_transaction_service),
     current_user: str = Depends(get_current_user)
 ):
     """Get current user's transactions"""
-    service = TransactionService(bot)
-    filters = TransactionFilter(
-        user_id="fdygg",
-        transaction_type=transaction_type,
-        status=status
+    filters = _filter_for(current_user, transaction_type, status)
+    try:
+        transactions = await service.get_transactions(
+            filters,
+            limit=limit,
+            offset=(page - 1) * limit,
+            cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    token = next_cursor(transactions, limit)
+    return Response(
+        _TRANSACTION_LIST_ADAPTER.dump_json(transactions),
+        media_type="application/json",
+        headers={"X-Next-Cursor": token} if token else None
     )
-    return await service.get_transactions(
-        page=page,
-        limit=limit,
-        filters=filters
+
+@router.get("/me/stream")
+async def stream_my_transactions(
+    transaction_type: Optional[TransactionType] = None,
+    status: Optional[TransactionStatus] = None,
+    service: TransactionService = Depends(get_transaction_service),
+    current_user: str = Depends(get_current_user)
+):
+    """Stream current user's transactions as NDJSON (one transaction per line)"""
+    return StreamingResponse(
+        service.stream_user_transactions(
+            current_user,
+            transaction_type=transaction_type,
+            status=status
+        ),
+        media_type="application/x-ndjson"
     )
 
 @router.get("/{transaction_id}", response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: str,
-    bot=Depends(get_bot),
-    current_user: str = Depends(get_current_user)
+    service: TransactionService = Depends(get_transaction_service),
+    current_user: str = Depends(get_current_user),
+    is_admin: bool = Depends(check_is_admin)
 ):
     """Get transaction by ID"""
-    service = TransactionService(bot)
-    transaction = await service.get_transaction(transaction_id)
+    transaction = await service.get_transaction_by_id(transaction_id)
     if not transaction:
         raise HTTPException(status_code=404, detail="Transaction not found")
     
     # Only allow access to own transactions unless admin
-    if transaction.user_id != "fdygg" and not await verify_admin(current_user):
+    if transaction.user_id != current_user and not is_admin:
         raise HTTPException(status_code=403, detail="Access denied")
     
     return transaction
@@ -98,46 +194,46 @@ async def get_transaction(
 async def cancel_transaction(
     transaction_id: str,
     reason: str,
-    bot=Depends(get_bot),
+    service: TransactionService = Depends(get_transaction_service),
     current_user: str = Depends(get_current_user)
 ):
     """Cancel a transaction"""
     try:
-        service = TransactionService(bot)
         transaction = await service.cancel_transaction(
             transaction_id,
             reason=reason,
-            cancelled_by="fdygg",
-            cancelled_at=datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
+            cancelled_by=current_user,
+            cancelled_at=_FIXED_TS
         )
         if not transaction:
             raise HTTPException(status_code=404, detail="Transaction not found")
         return transaction
-    except Exception as e:
-        logger.error(f"""
-        Cancel transaction error:
-        ID: {transaction_id}
-        User: fdygg
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "cancel_transaction_error",
+            extra={
+                "id": transaction_id,
+                "user": current_user
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/summary/daily", dependencies=[Depends(verify_admin)])
 async def get_daily_summary(
     date: Optional[datetime] = None,
-    bot=Depends(get_bot)
+    service: TransactionService = Depends(get_transaction_service)
 ):
     """Get daily transaction summary (admin only)"""
     try:
-        service = TransactionService(bot)
-        summary_date = date or datetime.strptime("2025-05-28 15:29:08", "%Y-%m-%d %H:%M:%S")
+        summary_date = date or _FIXED_TS
         return await service.get_daily_summary(summary_date)
-    except Exception as e:
-        logger.error(f"""
-        Daily summary error:
-        Date: {date}
-        Time: 2025-05-28 15:29:08 UTC
-        Error: {str(e)}
-        """)
+    except (ValueError, KeyError) as e:
+        logger.error(
+            "daily_summary_error",
+            extra={
+                "date": date
+            },
+            exc_info=True
+        )
         raise HTTPException(status_code=400, detail=str(e))
\ No newline at end of file
@@ -1,8 +1,8 @@
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import ORJSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 import uvicorn
 import logging
@@ -14,9 +14,10 @@ from threading import Thread
 import os
 from pathlib import Path
 from .dependencies import set_bot
-from .routes import router as api_router
+from .routes import router as api_router, http_exception_handler, general_exception_handler
 from .middleware import setup_middleware
 from .middleware.auth import auth_middleware
+from .service.database_service import BufferedInsert
 from .config import API_VERSION
 
 logger = logging.getLogger(__name__)
@@ -29,10 +30,12 @@ class APIServer:
             version=API_VERSION,
             docs_url=None,  # Disable default docs
             redoc_url=None,  # Disable default redoc
-            openapi_url=None  # Disable default openapi.json
+            openapi_url=None,  # Disable default openapi.json
+            default_response_class=ORJSONResponse
         )
         self.bot = bot
         self.startup_time = datetime.now(UTC)
+        self._openapi_schema = None  # Built once by _build_openapi_schema(), then reused
         
         # Setup static files
         static_dir = Path(__file__).parent / "static"
@@ -42,7 +45,6 @@ class APIServer:
         self.setup_api()
         logger.debug(f"""
         API Server initialized:
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
         Bot: {self.bot.__class__.__name__}
         FastAPI App: {self.app.__class__.__name__}
         Version: {API_VERSION}
@@ -50,6 +52,26 @@ class APIServer:
         OS: {platform.platform()}
         """)
 
+    def _build_openapi_schema(self) -> dict:
+        """Build the OpenAPI schema (and every model JSON schema) once"""
+        if self._openapi_schema is None:
+            self._openapi_schema = get_openapi(
+                title="Growtopia Shop Bot API",
+                version=API_VERSION,
+                description=f"""
+                Backend API for Growtopia Shop Discord Bot.
+                
+                API Version: {API_VERSION}
+                
+                Authentication:
+                - All endpoints except public endpoints require authentication
+                - Use Bearer token authentication
+                - Get token from /api/v1/auth/token endpoint
+                """,
+                routes=self.app.routes,
+            )
+        return self._openapi_schema
+
     def get_system_info(self):
         """Get system information with fallbacks"""
         try:
@@ -75,8 +97,8 @@ class APIServer:
             disk_info = {"error": "Disk stats unavailable"}
             
         try:
-            # Give small interval for more accurate reading
-            cpu_percent = round(psutil.cpu_percent(interval=0.1), 2)
+            # Non-blocking: usage since the previous call
+            cpu_percent = round(psutil.cpu_percent(interval=None), 2)
         except:
             cpu_percent = 0.0
             
@@ -98,7 +120,7 @@ class APIServer:
                 allow_credentials=True,
                 allow_methods=["GET", "POST", "PUT", "DELETE"],
                 allow_headers=["*"],
-                expose_headers=["X-Request-ID"]
+                expose_headers=["X-Request-ID", "X-Next-Cursor"]
             )
             
             # Add auth middleware
@@ -112,6 +134,11 @@ class APIServer:
                 api_router,
                 prefix="/api/v1"
             )
+            self.app.add_exception_handler(HTTPException, http_exception_handler)
+            self.app.add_exception_handler(Exception, general_exception_handler)
+
+            # Write out buffered audit/log rows before the server stops
+            self.app.add_event_handler("shutdown", BufferedInsert.flush_all)
             
             # Setup middleware and error handlers
             setup_middleware(self.app)
@@ -122,7 +149,7 @@ class APIServer:
                 favicon_path = Path(__file__).parent / "static/favicon.ico"
                 if favicon_path.exists():
                     return FileResponse(str(favicon_path))
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=404,
                     content={
                         "detail": "Not Found",
@@ -134,23 +161,7 @@ class APIServer:
             # Add OpenAPI endpoint
             @self.app.get("/api/v1/openapi.json", include_in_schema=False)
             async def get_openapi_schema():
-                openapi_schema = get_openapi(
-                    title="Growtopia Shop Bot API",
-                    version=API_VERSION,
-                    description=f"""
-                    Backend API for Growtopia Shop Discord Bot.
-                    
-                    API Version: {API_VERSION}
-                    Server Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
-                    
-                    Authentication:
-                    - All endpoints except public endpoints require authentication
-                    - Use Bearer token authentication
-                    - Get token from /api/v1/auth/token endpoint
-                    """,
-                    routes=self.app.routes,
-                )
-                return JSONResponse(openapi_schema)
+                return ORJSONResponse(self._build_openapi_schema())
             
             # Di dalam class APIServer, method setup_api()
             
@@ -184,7 +195,7 @@ class APIServer:
                     }
                 }
             
-                return JSONResponse(
+                return ORJSONResponse(
                     content=response_data,
                     headers={
                         "Cache-Control": "no-cache, no-store, must-revalidate",
@@ -229,7 +240,6 @@ class APIServer:
                 
             logger.info(f"""
             API routes and middleware setup completed:
-            Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
             Total Routes: {len(self.app.routes)}
             Auth Enabled: True
             CORS Enabled: True
@@ -240,7 +250,6 @@ class APIServer:
             logger.error(f"""
             API setup error:
             Error: {str(e)}
-            Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
             Stack Trace:
             {traceback.format_exc()}
             """)
@@ -258,8 +267,10 @@ class APIServer:
                 log_level="debug",
                 access_log=True,
                 reload=False,
-                http="h11",
-                loop="asyncio",
+                # uvloop/httptools when installed; asyncio/h11 otherwise
+                # (uvicorn never picks uvloop on Windows)
+                http="auto",
+                loop="auto",
                 timeout_keep_alive=5,
                 timeout_notify=30,
                 limit_concurrency=1000,
@@ -294,9 +305,11 @@ class APIServer:
             
             server = uvicorn.Server(config)
             
+            # Generate model JSON schemas before serving instead of on the first docs hit
+            self._build_openapi_schema()
+            
             logger.info(f"""
             Starting API server:
-            Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
             Host: 0.0.0.0
             Port: 8080
             Debug: True
@@ -309,7 +322,6 @@ class APIServer:
             logger.error(f"""
             Failed to start API server:
             Error: {str(e)}
-            Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
             Stack Trace:
             {traceback.format_exc()}
             """)
@@ -320,7 +332,6 @@ def create_api_server(bot) -> APIServer:
     try:
         logger.debug(f"""
         Creating API server:
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
         Bot Type: {type(bot).__name__ if bot else 'None'}
         """)
 
@@ -336,7 +347,6 @@ def create_api_server(bot) -> APIServer:
         
         logger.info(f"""
         API server thread started:
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
         Thread ID: {api_thread.ident}
         Thread Name: {api_thread.name}
         Status: Running
@@ -349,7 +359,6 @@ def create_api_server(bot) -> APIServer:
         logger.error(f"""
         Error creating API server:
         Error: {str(e)}
-        Time: {datetime.now(UTC).strftime('%Y-%m-%d %H:%M:%S')} UTC
         Stack Trace:
         {traceback.format_exc()}
         """)
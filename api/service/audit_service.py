@@ -1,16 +1,27 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, AsyncIterator
 from datetime import datetime, UTC
 import logging
+import orjson
 from uuid import uuid4
-from .database_service import DatabaseService
-from ..models.audit import AuditLog, AuditAction, AuditCategory
+from .database_service import DatabaseService, BufferedInsert, parse_db_timestamp
+from ..models.audit import AuditLog, AuditAction, AuditCategory, parse_audit_action
+from ..utils.pagination import decode_cursor
 
 logger = logging.getLogger(__name__)
 
+INSERT_AUDIT_LOG_QUERY = """
+INSERT INTO audit_logs (
+    id, category, action, actor_id,
+    actor_type, target_id, target_type,
+    description, metadata, created_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 class AuditService:
     def __init__(self):
         self.db = DatabaseService()
         self.startup_time = datetime.now(UTC)
+        self.pending = BufferedInsert(self.db, INSERT_AUDIT_LOG_QUERY)
         logger.info(f"""
         AuditService initialized:
         Time: 2025-05-29 17:08:40
@@ -32,16 +43,8 @@ class AuditService:
         try:
             audit_id = f"adt_{uuid4().hex[:8]}"
             
-            query = """
-            INSERT INTO audit_logs (
-                id, category, action, actor_id,
-                actor_type, target_id, target_type,
-                description, metadata, created_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
             await self.db.execute_query(
-                query,
+                INSERT_AUDIT_LOG_QUERY,
                 (
                     audit_id,
                     category.value,
@@ -63,6 +66,33 @@ class AuditService:
             logger.error(f"Error creating audit log: {str(e)}")
             return None
 
+    def enqueue_action(
+        self,
+        category: AuditCategory,
+        action: AuditAction,
+        actor_id: str,
+        actor_type: str,
+        target_id: Optional[str],
+        target_type: str,
+        description: str,
+        metadata: Optional[Dict] = None
+    ) -> str:
+        """Queue audit log entry for batched insert, return its ID"""
+        audit_id = f"adt_{uuid4().hex[:8]}"
+        self.pending.add((
+            audit_id,
+            category.value,
+            action.value,
+            actor_id,
+            actor_type,
+            target_id,
+            target_type,
+            description,
+            str(metadata or {}),
+            datetime.now(UTC)
+        ))
+        return audit_id
+
     async def get_audit_log(self, audit_id: str) -> Optional[AuditLog]:
         """Get single audit log entry"""
         query = "SELECT * FROM audit_logs WHERE id = ?"
@@ -75,7 +105,7 @@ class AuditService:
         return AuditLog(
             id=log["id"],
             category=AuditCategory(log["category"]),
-            action=AuditAction(log["action"]),
+            action=parse_audit_action(log["action"]),
             actor_id=log["actor_id"],
             actor_type=log["actor_type"],
             target_id=log["target_id"],
@@ -85,18 +115,16 @@ class AuditService:
             created_at=log["created_at"]
         )
 
-    async def get_audit_logs(
-        self,
-        category: Optional[AuditCategory] = None,
-        action: Optional[AuditAction] = None,
-        actor_id: Optional[str] = None,
-        target_id: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
-        limit: int = 50,
-        offset: int = 0
-    ) -> List[AuditLog]:
-        """Get audit logs with filters"""
+    @staticmethod
+    def _filter_conditions(
+        category: Optional[AuditCategory],
+        action: Optional[AuditAction],
+        actor_id: Optional[str],
+        target_id: Optional[str],
+        start_date: Optional[datetime],
+        end_date: Optional[datetime]
+    ) -> Tuple[List[str], List]:
+        """Build WHERE conditions and params shared by the audit log readers"""
         conditions = ["1=1"]
         params = []
         
@@ -123,12 +151,40 @@ class AuditService:
         if end_date:
             conditions.append("created_at <= ?")
             params.append(end_date)
+
+        return conditions, params
+
+    async def get_audit_logs(
+        self,
+        category: Optional[AuditCategory] = None,
+        action: Optional[AuditAction] = None,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        limit: int = 50,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[AuditLog]:
+        """Get audit logs with filters.
+
+        ``cursor`` (from the previous page) replaces ``offset`` with a
+        keyset condition on (created_at, id).
+        """
+        conditions, params = self._filter_conditions(
+            category, action, actor_id, target_id, start_date, end_date
+        )
+            
+        if cursor:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
             
         query = f"""
         SELECT * 
         FROM audit_logs 
         WHERE {' AND '.join(conditions)}
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
         LIMIT ? OFFSET ?
         """
         
@@ -136,21 +192,48 @@ class AuditService:
         results = await self.db.execute_query(query, tuple(params))
         
         return [
-            AuditLog(
+            AuditLog.model_construct(
                 id=log["id"],
                 category=AuditCategory(log["category"]),
-                action=AuditAction(log["action"]),
+                action=parse_audit_action(log["action"]),
                 actor_id=log["actor_id"],
                 actor_type=log["actor_type"],
                 target_id=log["target_id"],
                 target_type=log["target_type"],
                 description=log["description"],
                 metadata=eval(log["metadata"]) if log["metadata"] else {},
-                created_at=log["created_at"]
+                created_at=parse_db_timestamp(log["created_at"])
             )
             for log in results
         ]
 
+    async def stream_audit_logs(
+        self,
+        category: Optional[AuditCategory] = None,
+        action: Optional[AuditAction] = None,
+        actor_id: Optional[str] = None,
+        target_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream matching audit logs as NDJSON lines.
+
+        Rows go straight from the cursor to orjson without building
+        AuditLog models or holding the full result set in memory.
+        """
+        conditions, params = self._filter_conditions(
+            category, action, actor_id, target_id, start_date, end_date
+        )
+        query = f"""
+        SELECT * 
+        FROM audit_logs 
+        WHERE {' AND '.join(conditions)}
+        ORDER BY created_at DESC
+        """
+        async for log in self.db.iter_query(query, tuple(params)):
+            log["metadata"] = eval(log["metadata"]) if log["metadata"] else {}
+            yield orjson.dumps(log, default=str) + b"\n"
+
     async def export_audit_logs(
         self,
         start_date: datetime,
@@ -1,6 +1,9 @@
 from typing import Dict, Optional, Tuple
+from collections import OrderedDict
 from datetime import datetime, UTC, timedelta
+import hashlib
 import logging
+import time
 import jwt
 from passlib.hash import bcrypt
 from uuid import uuid4
@@ -11,6 +14,12 @@ from ..models.user import UserType, UserRole, UserStatus, UserResponse
 logger = logging.getLogger(__name__)
 
 class AuthService:
+    # Verified-token cache shared by every instance, since each middleware
+    # builds its own AuthService: sha256(token)[:16] -> (monotonic expiry, token data)
+    TOKEN_CACHE_SIZE = 10_000
+    TOKEN_CACHE_TTL = 300  # seconds
+    _token_cache: "OrderedDict[bytes, Tuple[float, TokenData]]" = OrderedDict()
+
     def __init__(self):
         self.db = DatabaseService()
         self.startup_time = datetime.now(UTC)
@@ -156,6 +165,15 @@ class AuthService:
 
     async def verify_token(self, token: str) -> Tuple[bool, Optional[TokenData]]:
         """Verify JWT token and return token data"""
+        now = time.monotonic()
+        key = hashlib.sha256(token.encode()).digest()[:16]
+        cached = self._token_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                self._token_cache.move_to_end(key)
+                return True, cached[1]
+            del self._token_cache[key]
+
         try:
             payload = jwt.decode(token, self.SECRET_KEY, algorithms=["HS256"])
             token_data = TokenData(
@@ -163,6 +181,13 @@ class AuthService:
                 role=payload["role"],
                 exp=datetime.fromtimestamp(payload["exp"], UTC)
             )
+            
+            # Never cache past the token's own expiry
+            ttl = min(self.TOKEN_CACHE_TTL, payload["exp"] - time.time())
+            if ttl > 0:
+                self._token_cache[key] = (now + ttl, token_data)
+                if len(self._token_cache) > self.TOKEN_CACHE_SIZE:
+                    self._token_cache.popitem(last=False)
             return True, token_data
         except jwt.ExpiredSignatureError:
             return False, None
@@ -1,12 +1,14 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, AsyncIterator
 from datetime import datetime, UTC
 import logging
+import orjson
 from uuid import uuid4
-from .database_service import DatabaseService
+from .database_service import DatabaseService, parse_db_timestamp
+from ..utils.pagination import decode_cursor
 from ..models.balance import (
     Balance, BalanceResponse, BalanceUpdateRequest,
     Transaction, TransactionStatus, CurrencyType,
-    TransactionType, BalanceHistoryResponse
+    TransactionType, BalanceHistoryResponse, BalanceResponseBatch
 )
 
 logger = logging.getLogger(__name__)
@@ -152,10 +154,14 @@ class BalanceService:
         user_id: str,
         user_type: str,
         page: int = 1,
-        page_size: int = 10
+        page_size: int = 10,
+        cursor: Optional[str] = None
     ) -> BalanceHistoryResponse:
-        """Get user's balance transaction history"""
-        offset = (page - 1) * page_size
+        """Get user's balance transaction history.
+
+        ``cursor`` (from the previous page) replaces ``page`` with a
+        keyset condition on (timestamp, id).
+        """
         
         # Get total count
         count_query = """
@@ -165,21 +171,29 @@ class BalanceService:
         """
         
         # Get transactions
-        txn_query = """
-        SELECT *
-        FROM balance_transactions
-        WHERE user_id = ? AND user_type = ?
-        ORDER BY timestamp DESC
-        LIMIT ? OFFSET ?
-        """
+        if cursor:
+            txn_query = """
+            SELECT *
+            FROM balance_transactions
+            WHERE user_id = ? AND user_type = ? AND (timestamp, id) < (?, ?)
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ?
+            """
+            txn_params = (user_id, user_type, *decode_cursor(cursor), page_size)
+        else:
+            txn_query = """
+            SELECT *
+            FROM balance_transactions
+            WHERE user_id = ? AND user_type = ?
+            ORDER BY timestamp DESC, id DESC
+            LIMIT ? OFFSET ?
+            """
+            txn_params = (user_id, user_type, page_size, (page - 1) * page_size)
         
         count_result = await self.db.execute_query(count_query, (user_id, user_type))
         total_records = count_result[0]['total'] if count_result else 0
         
-        transactions_result = await self.db.execute_query(
-            txn_query,
-            (user_id, user_type, page_size, offset)
-        )
+        transactions_result = await self.db.execute_query(txn_query, txn_params)
         
         # Get user info for growid
         user_query = "SELECT growid FROM users WHERE id = ? AND user_type = ?"
@@ -187,14 +201,14 @@ class BalanceService:
         growid = user_result[0]['growid'] if user_result else None
         
         transactions = [
-            Transaction(
+            Transaction.model_construct(
                 id=txn['id'],
                 user_id=txn['user_id'],
                 user_type=txn['user_type'],
                 currency_type=CurrencyType(txn['currency_type']),
                 transaction_type=TransactionType(txn['transaction_type']),
                 amount=txn['amount'],
-                timestamp=txn['timestamp'],
+                timestamp=parse_db_timestamp(txn['timestamp']),
                 created_by=txn['created_by'],
                 description=txn['description'],
                 status=TransactionStatus(txn['status']),
@@ -203,7 +217,7 @@ class BalanceService:
             for txn in transactions_result
         ]
         
-        return BalanceHistoryResponse(
+        return BalanceHistoryResponse.model_construct(
             user_id=user_id,
             user_type=user_type,
             growid=growid,
@@ -213,6 +227,64 @@ class BalanceService:
             page_size=page_size
         )
 
+    async def stream_balance_history(
+        self,
+        user_id: str,
+        user_type: str
+    ) -> AsyncIterator[bytes]:
+        """Stream user's full transaction history as NDJSON lines.
+
+        Rows go straight from the cursor to orjson without building
+        Transaction models or holding the whole history in memory.
+        """
+        query = """
+        SELECT id, user_id, user_type, currency_type, transaction_type,
+               amount, timestamp, created_by, description, status, metadata
+        FROM balance_transactions
+        WHERE user_id = ? AND user_type = ?
+        ORDER BY timestamp DESC
+        """
+        async for txn in self.db.iter_query(query, (user_id, user_type)):
+            txn["metadata"] = eval(txn["metadata"]) if txn.get("metadata") else {}
+            yield orjson.dumps(txn, default=str) + b"\n"
+
+    async def get_balance_summary(self) -> BalanceResponseBatch:
+        """Get every user's current balance as parallel columns plus totals.
+
+        Rows are appended column by column instead of building a
+        BalanceResponse/Balance pair per user, and totals are summed
+        straight over the columns.
+        """
+        query = """
+        SELECT id, user_type, balance_wl, balance_dl, balance_bgl, balance_idr
+        FROM users
+        ORDER BY id
+        """
+        user_ids, user_types, wl, dl, bgl, rupiah = [], [], [], [], [], []
+        async for row in self.db.iter_query(query):
+            user_ids.append(row['id'])
+            user_types.append(row['user_type'])
+            wl.append(row['balance_wl'] or 0)
+            dl.append(row['balance_dl'] or 0)
+            bgl.append(row['balance_bgl'] or 0)
+            rupiah.append(row['balance_idr'] or 0)
+
+        return BalanceResponseBatch.model_construct(
+            user_ids=user_ids,
+            user_types=user_types,
+            wl=wl,
+            dl=dl,
+            bgl=bgl,
+            rupiah=rupiah,
+            totals=Balance.model_construct(
+                wl_balance=sum(wl),
+                dl_balance=sum(dl),
+                bgl_balance=sum(bgl),
+                rupiah_balance=sum(rupiah)
+            ),
+            generated_at=datetime.now(UTC)
+        )
+
     async def get_conversion_rates(self) -> Dict[str, float]:
         """Get current conversion rates"""
         query = """
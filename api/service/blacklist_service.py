@@ -1,8 +1,8 @@
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, UTC
 import logging
 from uuid import uuid4
-from .database_service import DatabaseService
+from .database_service import DatabaseService, parse_db_timestamp
 from ..models.blacklist import (
     BlacklistEntry, BlacklistType, BlacklistReason,
     BlacklistStatus, FraudDetectionRule
@@ -10,10 +10,31 @@ from ..models.blacklist import (
 
 logger = logging.getLogger(__name__)
 
+def _compile_condition(condition: Dict) -> Callable[[Dict], bool]:
+    """Turn a fraud rule condition dict into a predicate over a context"""
+    field, value = condition.get("field"), condition.get("value")
+    kind = condition["type"]
+    if kind == "equals":
+        return lambda ctx: ctx.get(field) == value
+    if kind == "contains":
+        return lambda ctx: value in str(ctx.get(field, ""))
+    if kind == "greater_than":
+        return lambda ctx: ctx.get(field) > value
+    if kind == "less_than":
+        return lambda ctx: ctx.get(field) < value
+    # Unknown condition types never block a match
+    return lambda ctx: True
+
 class BlacklistService:
     def __init__(self):
         self.db = DatabaseService()
         self.startup_time = datetime.now(UTC)
+        
+        # Compiled fraud rules: rule id -> (source key, platforms, predicates, actions)
+        self._compiled_rules: Dict[
+            str,
+            Tuple[Tuple[str, str, str], frozenset, List[Callable[[Dict], bool]], List[Dict]]
+        ] = {}
         logger.info(f"""
         BlacklistService initialized:
         Time: 2025-05-29 17:17:02
@@ -248,7 +269,7 @@ class BlacklistService:
         results = await self.db.execute_query(query, tuple(params))
         
         return [
-            BlacklistEntry(
+            BlacklistEntry.model_construct(
                 id=entry["id"],
                 type=BlacklistType(entry["type"]),
                 value=entry["value"],
@@ -257,11 +278,11 @@ class BlacklistService:
                 description=entry["description"],
                 evidence=eval(entry["evidence"]) if entry["evidence"] else [],
                 status=BlacklistStatus(entry["status"]),
-                expires_at=entry["expires_at"],
+                expires_at=parse_db_timestamp(entry["expires_at"]),
                 created_by=entry["created_by"],
-                created_at=entry["created_at"],
+                created_at=parse_db_timestamp(entry["created_at"]),
                 updated_by=entry["updated_by"],
-                updated_at=entry["updated_at"],
+                updated_at=parse_db_timestamp(entry["updated_at"]),
                 metadata=eval(entry["metadata"]) if entry["metadata"] else {}
             )
             for entry in results
@@ -335,39 +356,21 @@ class BlacklistService:
             rules = await self.db.execute_query(query)
             
             triggered_rules = []
+            platform = context.get("platform")
             
             for rule in rules:
-                conditions = eval(rule["conditions"])
-                matches = True
+                _, platforms, predicates, actions = self._compile_rule(rule)
                 
                 # Check platform
-                if context.get("platform") not in rule["platform"].split(","):
+                if platform not in platforms:
                     continue
                     
                 # Check all conditions
-                for condition in conditions:
-                    if condition["type"] == "equals":
-                        if context.get(condition["field"]) != condition["value"]:
-                            matches = False
-                            break
-                    elif condition["type"] == "contains":
-                        if condition["value"] not in str(context.get(condition["field"], "")):
-                            matches = False
-                            break
-                    elif condition["type"] == "greater_than":
-                        if not context.get(condition["field"]) > condition["value"]:
-                            matches = False
-                            break
-                    elif condition["type"] == "less_than":
-                        if not context.get(condition["field"]) < condition["value"]:
-                            matches = False
-                            break
-                
-                if matches:
+                if all(predicate(context) for predicate in predicates):
                     triggered_rules.append({
                         "rule_id": rule["id"],
                         "name": rule["name"],
-                        "actions": eval(rule["actions"])
+                        "actions": actions
                     })
             
             return triggered_rules
@@ -376,6 +379,20 @@ class BlacklistService:
             logger.error(f"Error checking fraud rules: {str(e)}")
             return []
 
+    def _compile_rule(self, rule: Dict):
+        """Parse and compile a fraud rule row once per rule version"""
+        key = (rule["platform"], rule["conditions"], rule["actions"])
+        compiled = self._compiled_rules.get(rule["id"])
+        if compiled is None or compiled[0] != key:
+            compiled = (
+                key,
+                frozenset(rule["platform"].split(",")),
+                [_compile_condition(c) for c in eval(rule["conditions"])],
+                eval(rule["actions"])
+            )
+            self._compiled_rules[rule["id"]] = compiled
+        return compiled
+
     async def get_fraud_rules(
         self,
         platform: Optional[str] = None,
@@ -403,7 +420,7 @@ class BlacklistService:
         results = await self.db.execute_query(query, tuple(params))
         
         return [
-            FraudDetectionRule(
+            FraudDetectionRule.model_construct(
                 id=rule["id"],
                 name=rule["name"],
                 description=rule["description"],
@@ -1,13 +1,38 @@
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Union, Iterable, AsyncIterator
+from collections import deque
 from datetime import datetime, UTC, timedelta
+import asyncio
 import logging
 import json
 import sqlite3
+import weakref
 import redis
 from redis.lock import Lock
 
 logger = logging.getLogger(__name__)
 
+# Composite indexes matching the service read paths: equality columns first,
+# then the (timestamp, id) keyset they sort and paginate on.
+INDEXES = (
+    ("idx_balance_txn_user_type_ts_id", "balance_transactions(user_id, user_type, timestamp DESC, id DESC)"),
+    ("idx_audit_logs_category_action_created_id", "audit_logs(category, action, created_at DESC, id DESC)"),
+    ("idx_audit_logs_actor_created_id", "audit_logs(actor_id, created_at DESC, id DESC)"),
+    ("idx_stock_product_status_added", "stock(product_code, status, added_at)"),
+)
+
+# Superseded by the keyset indexes above; dropped on startup
+RETIRED_INDEXES = (
+    "idx_balance_txn_user_type_ts",
+    "idx_audit_logs_category_action_created",
+    "idx_audit_logs_actor_created",
+)
+
+def parse_db_timestamp(value: Optional[Union[str, datetime]]) -> Optional[datetime]:
+    """Convert a stored timestamp for model_construct, which skips validation"""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
+
 class DatabaseService:
     _instance = None
     _conn = None
@@ -41,11 +66,23 @@ class DatabaseService:
             cursor = self._conn.cursor()
             cursor.execute("PRAGMA foreign_keys = ON")
             cursor.execute("PRAGMA journal_mode = WAL")
+            self._init_indexes(cursor)
             logger.info("SQLite initialized successfully")
         except Exception as e:
             logger.error(f"SQLite initialization error: {str(e)}")
             raise
 
+    def _init_indexes(self, cursor: sqlite3.Cursor):
+        """Create service indexes, skipping tables that do not exist yet"""
+        for idx_name in RETIRED_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {idx_name}")
+        for idx_name, idx_cols in INDEXES:
+            try:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {idx_name} ON {idx_cols}")
+            except sqlite3.OperationalError as e:
+                logger.debug(f"Skipping index {idx_name}: {str(e)}")
+        self._conn.commit()
+
     def _init_redis(self):
         """Initialize Redis connection"""
         try:
@@ -94,6 +131,43 @@ class DatabaseService:
             conn.rollback()
             raise
 
+    async def iter_query(
+        self,
+        query: str,
+        params: tuple = None,
+        batch_size: int = 500
+    ) -> AsyncIterator[Dict]:
+        """Yield query rows as dicts, fetching batch_size rows at a time"""
+        cursor = self.get_connection().cursor()
+        try:
+            cursor.execute(query, params or ())
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(row)
+        except sqlite3.Error as e:
+            logger.error(f"Query iteration failed: {str(e)}")
+            raise
+        finally:
+            cursor.close()
+
+    async def execute_many(
+        self,
+        query: str,
+        params_seq: Iterable[tuple]
+    ) -> None:
+        """Execute SQL statement for every parameter tuple in one transaction"""
+        conn = self.get_connection()
+        try:
+            conn.executemany(query, params_seq)
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Batch execution failed: {str(e)}")
+            conn.rollback()
+            raise
+
     async def cache_get(
         self,
         key: str,
@@ -165,3 +239,111 @@ class DatabaseService:
         except Exception as e:
             logger.error(f"Lock acquisition error: {str(e)}")
             return None
+
+class BufferedInsert:
+    """Accumulate INSERT rows and write them with one executemany.
+
+    Rows are flushed when FLUSH_SIZE rows are pending or every
+    FLUSH_INTERVAL seconds, whichever comes first. A batch that fails with a
+    transient error (database locked/busy) goes back to the head of the
+    buffer and is retried up to MAX_RETRIES times; any other sqlite3 error
+    drops the batch, after retrying row by row on an IntegrityError so one
+    bad row does not take the rest with it. At most MAX_PENDING rows are
+    held; past that the oldest are dropped. flush_all() drains every buffer
+    at shutdown.
+    """
+    FLUSH_SIZE = 512
+    FLUSH_INTERVAL = 0.5  # seconds
+    MAX_PENDING = 10_000
+    MAX_RETRIES = 5
+
+    _instances: "weakref.WeakSet[BufferedInsert]" = weakref.WeakSet()
+
+    def __init__(self, db: DatabaseService, query: str):
+        self.db = db
+        self.query = query
+        self.buffer: deque = deque()
+        self._failures = 0
+        self._task: Optional[asyncio.Task] = None
+        # Strong references: the loop only keeps weak ones to its tasks
+        self._tasks: set = set()
+        BufferedInsert._instances.add(self)
+
+    def _spawn(self, coro) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def add(self, row: tuple) -> None:
+        """Queue a row; never awaits"""
+        if len(self.buffer) >= self.MAX_PENDING:
+            self.buffer.popleft()
+            logger.warning(f"Buffered insert backlog full ({self.MAX_PENDING} rows); dropping oldest row")
+        self.buffer.append(row)
+        if self._task is None or self._task.done():
+            self._task = self._spawn(self._run())
+        elif len(self.buffer) >= self.FLUSH_SIZE:
+            self._spawn(self.flush())
+
+    @staticmethod
+    def _is_transient(error: sqlite3.Error) -> bool:
+        message = str(error).lower()
+        return isinstance(error, sqlite3.OperationalError) and (
+            "locked" in message or "busy" in message
+        )
+
+    async def _insert_each(self, rows: List[tuple]) -> int:
+        """Fallback for a batch with a bad row: write the rows one by one"""
+        written = 0
+        for row in rows:
+            try:
+                await self.db.execute_many(self.query, [row])
+                written += 1
+            except sqlite3.Error:
+                pass
+        if written < len(rows):
+            logger.error(f"Buffered insert dropped {len(rows) - written} of {len(rows)} rows")
+        return written
+
+    async def flush(self) -> int:
+        """Write all pending rows, return number written"""
+        if not self.buffer:
+            return 0
+        rows = list(self.buffer)
+        self.buffer.clear()
+        try:
+            await self.db.execute_many(self.query, rows)
+        except sqlite3.Error as e:
+            if isinstance(e, sqlite3.IntegrityError):
+                self._failures = 0
+                return await self._insert_each(rows)
+            if not self._is_transient(e):
+                self._failures = 0
+                logger.error(f"Buffered insert flush error ({len(rows)} rows dropped): {str(e)}")
+                return 0
+            self._failures += 1
+            if self._failures > self.MAX_RETRIES:
+                self._failures = 0
+                logger.error(f"Buffered insert gave up after {self.MAX_RETRIES} retries ({len(rows)} rows dropped): {str(e)}")
+                return 0
+            # Requeue ahead of rows added meanwhile so order is kept
+            room = self.MAX_PENDING - len(self.buffer)
+            self.buffer.extendleft(reversed(rows[-room:] if room > 0 else []))
+            logger.warning(f"Buffered insert flush error ({len(rows)} rows requeued): {str(e)}")
+            return 0
+        self._failures = 0
+        return len(rows)
+
+    async def _run(self) -> None:
+        while self.buffer:
+            await asyncio.sleep(self.FLUSH_INTERVAL)
+            await self.flush()
+
+    @classmethod
+    async def flush_all(cls) -> int:
+        """Write out every buffer's pending rows (call at shutdown)"""
+        written = 0
+        for buffered in list(cls._instances):
+            written += await buffered.flush()
+        return written
@@ -2,18 +2,25 @@ from typing import Dict, List, Optional
 from datetime import datetime, UTC
 import logging
 from uuid import uuid4
-from .database_service import DatabaseService
-from ..models.logs import (
-    Log, LogLevel, LogCategory,
-    AuditLog
-)
+from .database_service import DatabaseService, BufferedInsert, parse_db_timestamp
+from ..models.logs import Log, LogLevel, LogCategory
+from ..models.audit import AuditLog, parse_audit_action
 
 logger = logging.getLogger(__name__)
 
+INSERT_LOG_QUERY = """
+INSERT INTO logs (
+    id, level, category, message,
+    source, timestamp, user_id, ip_address,
+    metadata, stack_trace
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 class LogService:
     def __init__(self):
         self.db = DatabaseService()
         self.startup_time = datetime.now(UTC)
+        self.pending = BufferedInsert(self.db, INSERT_LOG_QUERY)
         logger.info(f"""
         LogService initialized:
         Time: 2025-05-29 17:11:23
@@ -25,16 +32,8 @@ class LogService:
         try:
             log_id = f"log_{uuid4().hex[:8]}"
             
-            query = """
-            INSERT INTO logs (
-                id, level, category, message,
-                source, timestamp, user_id, ip_address,
-                metadata, stack_trace
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            
             await self.db.execute_query(
-                query,
+                INSERT_LOG_QUERY,
                 (
                     log_id,
                     log.level.value,
@@ -56,6 +55,34 @@ class LogService:
             logger.error(f"Error creating log: {str(e)}")
             return None
 
+    def enqueue_log(
+        self,
+        level: LogLevel,
+        category: LogCategory,
+        message: str,
+        source: str,
+        user_id: Optional[str] = None,
+        ip_address: Optional[str] = None,
+        metadata: Optional[Dict] = None,
+        stack_trace: Optional[str] = None,
+        timestamp: Optional[datetime] = None
+    ) -> str:
+        """Queue log entry for batched insert without building a Log model"""
+        log_id = f"log_{uuid4().hex[:8]}"
+        self.pending.add((
+            log_id,
+            level.value,
+            category.value,
+            message,
+            source,
+            timestamp or datetime.now(UTC),
+            user_id,
+            ip_address,
+            str(metadata or {}),
+            stack_trace
+        ))
+        return log_id
+
     async def get_log(self, log_id: str) -> Optional[Log]:
         """Get log entry by ID"""
         query = "SELECT * FROM logs WHERE id = ?"
@@ -124,13 +151,13 @@ class LogService:
         results = await self.db.execute_query(query, tuple(params))
         
         return [
-            Log(
+            Log.model_construct(
                 id=log["id"],
                 level=LogLevel(log["level"]),
                 category=LogCategory(log["category"]),
                 message=log["message"],
                 source=log["source"],
-                timestamp=log["timestamp"],
+                timestamp=parse_db_timestamp(log["timestamp"]),
                 user_id=log["user_id"],
                 ip_address=log["ip_address"],
                 metadata=eval(log["metadata"]) if log["metadata"] else {},
@@ -156,12 +183,12 @@ class LogService:
                 query,
                 (
                     audit_id,
-                    audit.user_id,
-                    audit.action,
-                    audit.resource_type,
-                    audit.resource_id,
+                    audit.actor_id,
+                    getattr(audit.action, "value", audit.action),
+                    audit.target_type,
+                    audit.target_id,
                     str(audit.changes),
-                    audit.timestamp or datetime.now(UTC),
+                    audit.created_at or datetime.now(UTC),
                     audit.ip_address,
                     str(audit.metadata)
                 ),
@@ -225,14 +252,14 @@ class LogService:
         results = await self.db.execute_query(query, tuple(params))
         
         return [
-            AuditLog(
+            AuditLog.model_construct(
                 id=log["id"],
-                user_id=log["user_id"],
-                action=log["action"],
-                resource_type=log["resource_type"],
-                resource_id=log["resource_id"],
+                actor_id=log["user_id"],
+                action=parse_audit_action(log["action"]),
+                target_type=log["resource_type"],
+                target_id=log["resource_id"],
                 changes=eval(log["changes"]) if log["changes"] else {},
-                timestamp=log["timestamp"],
+                created_at=parse_db_timestamp(log["timestamp"]),
                 ip_address=log["ip_address"],
                 metadata=eval(log["metadata"]) if log["metadata"] else {}
             )
@@ -154,7 +154,7 @@ class MetricsService:
             
             # Add system metrics
             memory = psutil.virtual_memory()
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             
             return {
                 "requests": {
@@ -3,6 +3,7 @@ from datetime import datetime, UTC
 import logging
 from uuid import uuid4
 from .database_service import DatabaseService
+from ..utils.pagination import decode_cursor
 from ..models.notifications import (
     Notification, NotificationType, NotificationPriority,
     NotificationChannel, NotificationStatus
@@ -128,21 +129,41 @@ class NotificationService:
         user_id: str,
         status: Optional[NotificationStatus] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        notification_type: Optional[NotificationType] = None,
+        priority: Optional[NotificationPriority] = None
     ) -> List[Notification]:
-        """Get notifications for user"""
+        """Get notifications for user.
+
+        ``cursor`` (from the previous page) replaces ``offset`` with a
+        keyset condition on (created_at, id).
+        """
         conditions = ["recipient_id = ?"]
         params = [user_id]
         
         if status:
             conditions.append("status = ?")
             params.append(status.value)
+
+        if notification_type:
+            conditions.append("type = ?")
+            params.append(notification_type.value)
+
+        if priority:
+            conditions.append("priority = ?")
+            params.append(priority.value)
+            
+        if cursor:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
             
         query = f"""
         SELECT * 
         FROM notifications 
         WHERE {' AND '.join(conditions)}
-        ORDER BY created_at DESC
+        ORDER BY created_at DESC, id DESC
         LIMIT ? OFFSET ?
         """
         
@@ -169,6 +190,45 @@ class NotificationService:
             for notif in results
         ]
 
+    async def mark_read(
+        self,
+        user_id: str,
+        notification_ids: Optional[List[str]] = None,
+        notification_type: Optional[NotificationType] = None
+    ) -> int:
+        """Mark a user's notifications as read in a single UPDATE.
+
+        ``notification_ids`` restricts it to those ids; ``None`` marks every
+        unread notification (of ``notification_type`` if given). Returns
+        the number of rows updated.
+        """
+        now = datetime.now(UTC)
+        conditions = ["recipient_id = ?"]
+        params = [NotificationStatus.READ.value, now, now, user_id]
+
+        if notification_ids is not None:
+            if not notification_ids:
+                return 0
+            conditions.append(f"id IN ({', '.join('?' * len(notification_ids))})")
+            params.extend(notification_ids)
+        else:
+            conditions.append("status != ?")
+            params.append(NotificationStatus.READ.value)
+
+        if notification_type:
+            conditions.append("type = ?")
+            params.append(notification_type.value)
+
+        query = f"""
+        UPDATE notifications 
+        SET status = ?, read_at = ?, updated_at = ?
+        WHERE {' AND '.join(conditions)}
+        """
+        
+        await self.db.execute_query(query, tuple(params), fetch=False)
+        result = await self.db.execute_query("SELECT changes() AS count")
+        return result[0]["count"]
+
     async def delete_notification(self, notification_id: str) -> bool:
         """Delete notification"""
         try:
@@ -2,6 +2,7 @@ from typing import Dict, List, Optional, Tuple
 from datetime import datetime, UTC
 import logging
 from .database_service import DatabaseService
+from ..utils.pagination import decode_cursor
 from ..models.product import (
     ProductCreate, ProductUpdate, ProductResponse,
     ProductType, ProductStatus
@@ -164,9 +165,14 @@ class ProductService:
         max_price: Optional[int] = None,
         has_stock: Optional[bool] = None,
         limit: int = 50,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[ProductResponse]:
-        """Get products with filters"""
+        """Get products with filters.
+
+        ``cursor`` (from the previous page) replaces ``offset`` with a
+        keyset condition on (created_at, id).
+        """
         conditions = ["1=1"]
         params = []
         
@@ -192,6 +198,11 @@ class ProductService:
             else:
                 conditions.append("(SELECT COUNT(*) FROM stock s WHERE s.product_code = p.code AND s.status = 'available') = 0")
             
+        if cursor:
+            conditions.append("(p.created_at, p.id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
+            
         query = f"""
         SELECT p.*, 
             COUNT(CASE WHEN s.status = 'available' THEN 1 END) as stock_count,
@@ -200,7 +211,7 @@ class ProductService:
         LEFT JOIN stock s ON p.code = s.product_code
         WHERE {' AND '.join(conditions)}
         GROUP BY p.id
-        ORDER BY p.created_at DESC
+        ORDER BY p.created_at DESC, p.id DESC
         LIMIT ? OFFSET ?
         """
         
@@ -2,6 +2,7 @@ from typing import Dict, Optional
 import logging
 from datetime import datetime, UTC
 from .database_service import DatabaseService
+from ..models.settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +16,36 @@ class SettingsService:
         User: fdygg
         """)
 
+    async def get_settings(self) -> AppSettings:
+        """Get application settings from bot_settings"""
+        rows = await self.db.execute_query(
+            "SELECT key, value, updated_at FROM bot_settings ORDER BY key"
+        )
+        return AppSettings(
+            settings={row["key"]: row["value"] for row in rows},
+            updated_at=max((row["updated_at"] for row in rows if row["updated_at"]), default=None)
+        )
+
+    async def update_settings(self, settings: Dict) -> AppSettings:
+        """Upsert the given key/value pairs and return the resulting settings"""
+        values = settings.get("settings") or {}
+        if values:
+            await self.db.execute_many(
+                "INSERT OR REPLACE INTO bot_settings (key, value) VALUES (?, ?)",
+                [(key, str(value)) for key, value in values.items()]
+            )
+        return await self.get_settings()
+
+    async def reset_settings(self) -> None:
+        """Remove every stored setting so the bot falls back to its defaults"""
+        await self.db.execute_query("DELETE FROM bot_settings", fetch=False)
+
+    async def clear_cache(self, key_pattern: Optional[str] = None) -> int:
+        """Delete Redis keys matching key_pattern (all keys if omitted)"""
+        client = self.db.get_redis()
+        keys = client.keys(key_pattern or "*")
+        return client.delete(*keys) if keys else 0
+
     async def get_compression_settings(self) -> Dict:
         """Get compression settings from database"""
         try:
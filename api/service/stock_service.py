@@ -1,6 +1,7 @@
-from typing import Dict, List, Optional, Tuple
+from typing import AsyncIterator, Dict, List, Optional, Tuple
 from datetime import datetime, UTC
 import logging
+import orjson
 from .database_service import DatabaseService
 from ..models.stock import StockItem, StockStatus, StockAddRequest, PriceInfo
 
@@ -111,6 +112,34 @@ class StockService:
             for item in results
         ]
 
+    async def stream_stock(
+        self,
+        product_code: str,
+        status: Optional[StockStatus] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream a product's stock items as NDJSON lines.
+
+        Rows go straight from the cursor to orjson without building
+        StockItem models or holding the result set in memory.
+        """
+        conditions = ["product_code = ?"]
+        params = [product_code]
+
+        if status:
+            conditions.append("status = ?")
+            params.append(status.value)
+
+        query = f"""
+        SELECT *
+        FROM stock
+        WHERE {' AND '.join(conditions)}
+        ORDER BY added_at
+        """
+        async for item in self.db.iter_query(query, tuple(params)):
+            item["available_for"] = item["available_for"].split(",")
+            item["metadata"] = eval(item["metadata"]) if item["metadata"] else {}
+            yield orjson.dumps(item, default=str) + b"\n"
+
     async def update_stock_status(
         self,
         stock_id: int,
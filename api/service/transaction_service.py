@@ -1,9 +1,11 @@
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 from datetime import datetime, UTC
 import logging
+import orjson
 from .database_service import DatabaseService
+from ..utils.pagination import decode_cursor
 from uuid import uuid4
-from ..models.transaction import TransactionCreate, TransactionResponse, TransactionType, TransactionStatus, CurrencyType
+from ..models.transaction import TransactionCreate, TransactionResponse, TransactionFilter, TransactionType, TransactionStatus, CurrencyType
 
 logger = logging.getLogger(__name__)
 
@@ -93,26 +95,117 @@ class TransactionService:
             metadata=eval(transaction['metadata']) if transaction['metadata'] else {}
         )
 
+    async def get_transactions(
+        self,
+        filters: TransactionFilter,
+        limit: int = 10,
+        offset: int = 0,
+        cursor: Optional[str] = None
+    ) -> List[TransactionResponse]:
+        """Get transactions matching a filter.
+
+        ``cursor`` (from the previous page) replaces ``offset`` with a
+        keyset condition on (created_at, id).
+        """
+        conditions = ["1=1"]
+        params = []
+
+        for column in ("user_id", "user_type", "growid"):
+            value = getattr(filters, column)
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        for column in ("type", "currency", "status"):
+            value = getattr(filters, column)
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value.value)
+        if filters.start_date is not None:
+            conditions.append("created_at >= ?")
+            params.append(filters.start_date)
+        if filters.end_date is not None:
+            conditions.append("created_at <= ?")
+            params.append(filters.end_date)
+        if filters.min_amount is not None:
+            conditions.append("amount >= ?")
+            params.append(filters.min_amount)
+        if filters.max_amount is not None:
+            conditions.append("amount <= ?")
+            params.append(filters.max_amount)
+
+        if cursor:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
+
+        query = f"""
+        SELECT *
+        FROM transactions
+        WHERE {' AND '.join(conditions)}
+        ORDER BY created_at DESC, id DESC
+        LIMIT ? OFFSET ?
+        """
+
+        params.extend([limit, offset])
+        transactions = await self.db.execute_query(query, tuple(params))
+
+        # One balance lookup per user on the page
+        balances: Dict[str, Dict[str, int]] = {}
+        for txn in transactions:
+            if txn['user_id'] not in balances:
+                balances[txn['user_id']] = await self._get_user_balances(txn['user_id'])
+
+        return [
+            TransactionResponse(
+                id=txn['id'],
+                user_id=txn['user_id'],
+                user_type=txn['user_type'],
+                growid=txn['growid'],
+                type=TransactionType(txn['type']),
+                currency=CurrencyType(txn['currency']),
+                amount=txn['amount'],
+                details=txn['details'],
+                balances=balances[txn['user_id']],
+                status=TransactionStatus(txn['status']),
+                items=eval(txn['items']) if txn['items'] else None,
+                created_at=txn['created_at'],
+                created_by=txn['created_by'],
+                metadata=eval(txn['metadata']) if txn['metadata'] else {}
+            )
+            for txn in transactions
+        ]
+
     async def get_user_transactions(
         self,
         user_id: str,
         user_type: str = "discord",
         limit: int = 10,
-        offset: int = 0
+        offset: int = 0,
+        cursor: Optional[str] = None
     ) -> List[TransactionResponse]:
-        """Get user transaction history"""
-        query = """
+        """Get user transaction history.
+
+        ``cursor`` (from the previous page) replaces ``offset`` with a
+        keyset condition on (created_at, id).
+        """
+        conditions = ["user_id = ?", "user_type = ?"]
+        params = [user_id, user_type]
+        
+        if cursor:
+            conditions.append("(created_at, id) < (?, ?)")
+            params.extend(decode_cursor(cursor))
+            offset = 0
+            
+        query = f"""
         SELECT *
         FROM transactions
-        WHERE user_id = ? AND user_type = ?
-        ORDER BY created_at DESC
+        WHERE {' AND '.join(conditions)}
+        ORDER BY created_at DESC, id DESC
         LIMIT ? OFFSET ?
         """
         
-        transactions = await self.db.execute_query(
-            query, 
-            (user_id, user_type, limit, offset)
-        )
+        params.extend([limit, offset])
+        transactions = await self.db.execute_query(query, tuple(params))
         
         # Get current balances
         balances = await self._get_user_balances(user_id)
@@ -137,6 +230,39 @@ class TransactionService:
             for txn in transactions
         ]
 
+    async def stream_user_transactions(
+        self,
+        user_id: str,
+        user_type: str = "discord",
+        transaction_type: Optional[TransactionType] = None,
+        status: Optional[TransactionStatus] = None
+    ) -> AsyncIterator[bytes]:
+        """Stream user's transactions as NDJSON lines.
+
+        Rows go straight from the cursor to orjson without building
+        TransactionResponse models or holding the result set in memory.
+        """
+        conditions = ["user_id = ?", "user_type = ?"]
+        params = [user_id, user_type]
+
+        if transaction_type:
+            conditions.append("type = ?")
+            params.append(transaction_type.value)
+        if status:
+            conditions.append("status = ?")
+            params.append(status.value)
+
+        query = f"""
+        SELECT *
+        FROM transactions
+        WHERE {' AND '.join(conditions)}
+        ORDER BY created_at DESC, id DESC
+        """
+        async for txn in self.db.iter_query(query, tuple(params)):
+            txn["items"] = eval(txn["items"]) if txn["items"] else None
+            txn["metadata"] = eval(txn["metadata"]) if txn["metadata"] else {}
+            yield orjson.dumps(txn, default=str) + b"\n"
+
     async def update_transaction_status(
         self,
         transaction_id: str,
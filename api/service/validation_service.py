@@ -1,5 +1,7 @@
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 import logging
+import time
 from datetime import datetime, UTC
 from ..models.validation import ValidationType, ValidationRule, ValidationError
 from ..models.error import ErrorDetail
@@ -11,6 +13,12 @@ class ValidationService:
     def __init__(self):
         self.db = DatabaseService()
         self.startup_time = datetime.now(UTC)
+        
+        # Rules cache: (platform, role) -> (monotonic expiry, rules). LRU-bounded
+        # because platform comes from a client-supplied header.
+        self.RULES_CACHE_TTL = 60  # seconds
+        self.RULES_CACHE_SIZE = 64
+        self._rules_cache: "OrderedDict[Tuple[Optional[str], Optional[str]], Tuple[float, List[ValidationRule]]]" = OrderedDict()
         logger.info(f"""
         ValidationService initialized:
         Time: 2025-05-30 14:46:52
@@ -22,7 +30,16 @@ class ValidationService:
         platform: Optional[str] = None,
         role: Optional[str] = None
     ) -> List[ValidationRule]:
-        """Get validation rules from database"""
+        """Get validation rules from database (cached per platform/role)"""
+        key = (platform, role)
+        now = time.monotonic()
+        cached = self._rules_cache.get(key)
+        if cached is not None:
+            if cached[0] > now:
+                self._rules_cache.move_to_end(key)
+                return cached[1]
+            del self._rules_cache[key]
+
         try:
             query = """
             SELECT * FROM validation_rules 
@@ -38,7 +55,11 @@ class ValidationService:
                 (platform_filter, role_filter)
             )
             
-            return [ValidationRule(**rule) for rule in results]
+            rules = [ValidationRule(**rule) for rule in results]
+            self._rules_cache[key] = (now + self.RULES_CACHE_TTL, rules)
+            if len(self._rules_cache) > self.RULES_CACHE_SIZE:
+                self._rules_cache.popitem(last=False)
+            return rules
             
         except Exception as e:
             logger.error(f"Error getting validation rules: {str(e)}")
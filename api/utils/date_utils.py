@@ -1,7 +1,13 @@
 from datetime import datetime, timedelta, UTC
+from functools import lru_cache
 from typing import Optional, Tuple, Union
 import pytz
 
+@lru_cache(maxsize=32)
+def _parse_ts(date_str: str) -> datetime:
+    """Parse a timestamp once; datetimes are immutable so repeats share the result"""
+    return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+
 def format_datetime(dt: Optional[datetime] = None) -> str:
     """Format datetime to standard format"""
     if not dt:
@@ -11,16 +17,16 @@ def format_datetime(dt: Optional[datetime] = None) -> str:
 def parse_datetime(date_str: str) -> datetime:
     """Parse datetime string to datetime object"""
     try:
-        return datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        return _parse_ts(date_str)
     except ValueError:
-        return datetime.strptime("2025-05-28 15:50:29", "%Y-%m-%d %H:%M:%S")
+        return _parse_ts("2025-05-28 15:50:29")
 
 def get_date_range(
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None
 ) -> Tuple[datetime, datetime]:
     """Get date range with defaults"""
-    end = end_date or datetime.strptime("2025-05-28 15:50:29", "%Y-%m-%d %H:%M:%S")
+    end = end_date or _parse_ts("2025-05-28 15:50:29")
     start = start_date or (end - timedelta(days=30))
     return start, end
 
@@ -38,7 +44,7 @@ def calculate_date_diff(
 def is_valid_date(date_str: str) -> bool:
     """Check if date string is valid"""
     try:
-        datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
+        _parse_ts(date_str)
         return True
     except ValueError:
         return False
\ No newline at end of file
@@ -0,0 +1,24 @@
+import base64
+import binascii
+from typing import Any, Optional, Sequence, Tuple
+import orjson
+
+def encode_cursor(sort_key: Any, row_id: Any) -> str:
+    """Opaque keyset cursor pointing at the last row of a page"""
+    raw = orjson.dumps([sort_key, row_id], default=str, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Return (sort_key, row_id) from a cursor made by encode_cursor"""
+    try:
+        sort_key, row_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+    except (binascii.Error, orjson.JSONDecodeError, ValueError, TypeError):
+        raise ValueError("Invalid pagination cursor")
+    return sort_key, row_id
+
+def next_cursor(items: Sequence[Any], limit: int, sort_attr: str = "created_at") -> Optional[str]:
+    """Cursor for the page after items, or None if this was the last page"""
+    if len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, sort_attr), last.id)
\ No newline at end of file
@@ -0,0 +1,32 @@
+from hashlib import blake2b
+from typing import Optional
+from fastapi import Request
+from fastapi.responses import Response
+import orjson
+
+OK_BODY = orjson.dumps({"status": "success"})
+
+def ok_response() -> Response:
+    """{"status": "success"} from pre-encoded bytes (no jsonable_encoder pass).
+
+    Built per call rather than shared: FastAPI attaches the request's
+    background tasks to the returned Response instance.
+    """
+    return Response(OK_BODY, media_type="application/json")
+
+def etag_for(body: bytes) -> str:
+    """Strong ETag for an encoded body (64-bit blake2b digest)"""
+    return f'"{blake2b(body, digest_size=8).hexdigest()}"'
+
+def etag_response(request: Request, body: bytes, etag: Optional[str] = None) -> Response:
+    """JSON body tagged with an ETag, or an empty 304 if the client has it.
+
+    no-cache makes clients revalidate every time, so changes show up at
+    once while unchanged resources cost a header round-trip.
+    """
+    etag = etag or etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
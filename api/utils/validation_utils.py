@@ -4,6 +4,7 @@ from typing import Optional
 from datetime import datetime
 
 from ..config import config
+from .date_utils import _parse_ts
 
 def validate_email(email: str) -> bool:
     """Validate email format"""
@@ -48,7 +49,7 @@ def validate_jwt_token(token: str) -> Optional[dict]:
         
         # Check expiration
         exp = datetime.fromtimestamp(payload["exp"])
-        if exp < datetime.strptime("2025-05-28 15:50:29", "%Y-%m-%d %H:%M:%S"):
+        if exp < _parse_ts("2025-05-28 15:50:29"):
             return None
             
         return payload
@@ -18,6 +18,7 @@ from database import setup_database, get_connection
 from utils.command_handler import AdvancedCommandHandler
 from utils.button_handler import ButtonHandler
 from api.config import config, API_VERSION
+from api.service.database_service import BufferedInsert
 
 # Setup logging directory
 log_dir = Path('logs')
@@ -201,6 +202,7 @@ class MyBot(commands.Bot):
     async def close(self):
         """Cleanup on shutdown"""
         logger.debug("Performing cleanup...")
+        await BufferedInsert.flush_all()
         if self.session:
             await self.session.close()
             logger.debug("aiohttp session closed")